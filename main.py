@@ -3,6 +3,7 @@ Test script for Thryv CRM integration
 """
 
 import os
+from dataclasses import dataclass, asdict
 from dotenv import load_dotenv
 from utils.config import load_config
 from managers.thryv_integrator import ThryvIntegrator
@@ -11,6 +12,24 @@ from utils.logger import setup_logger
 # Set up logger
 logger = setup_logger('thryv_test')
 
+@dataclass(frozen=True)
+class SampleLead:
+    """Fixed-layout test lead; cheaper than rebuilding a dict per run."""
+    title: str
+    year: int
+    make: str
+    model: str
+    price: int
+    source: str
+    listing_url: str
+    description: str
+    phone_number: str
+    date_posted: str
+
+    def to_dict(self):
+        """Convert to the plain-dict lead format the managers expect."""
+        return asdict(self)
+
 def test_thryv_integration():
     """Test Thryv CRM integration"""
     # Load configuration
@@ -32,19 +51,19 @@ def test_thryv_integration():
     
     # Test lead creation with sample data
     logger.info("Testing Thryv lead creation...")
-    sample_lead = {
-        'title': 'Test 2022 Toyota Camry (TESTING ONLY)',
-        'year': 2022,
-        'make': 'Toyota',
-        'model': 'Camry',
-        'price': 28000,
-        'source': 'Test Script',
-        'listing_url': 'https://example.com/test',
-        'description': 'This is a test lead created by the CarFinderAI testing script.',
-        'phone_number': '',  # Intentionally empty for testing
-        'date_posted': '2023-08-01'
-    }
-    
+    sample_lead = SampleLead(
+        title='Test 2022 Toyota Camry (TESTING ONLY)',
+        year=2022,
+        make='Toyota',
+        model='Camry',
+        price=28000,
+        source='Test Script',
+        listing_url='https://example.com/test',
+        description='This is a test lead created by the CarFinderAI testing script.',
+        phone_number='',  # Intentionally empty for testing
+        date_posted='2023-08-01'
+    ).to_dict()  # Managers still consume the plain-dict lead format
+
     # Map lead to Thryv format and display for verification
     logger.info("Mapping lead to Thryv format...")
     thryv_formatted = thryv.map_lead_to_thryv_format(sample_lead)
@@ -5,60 +5,105 @@ Coordinates the scraping, data storage, messaging, notifications, and CRM integr
 
 import sys
 import os
-import uuid
+import asyncio
 import argparse
-import traceback
 from datetime import datetime
 from utils.logger import setup_logger
 from utils.config import load_config
 from utils.ui_config_manager import is_crm_enabled
-from scrapers.craigslist_scraper import CraigslistScraper
-from managers.messaging_manager import MessagingManager
-from managers.data_manager import DataManager
-from managers.notification_manager import NotificationManager
-from managers.thryv_integrator import ThryvIntegrator
+
+# The scraper and real managers are imported lazily inside main() so that
+# mock/dry-run invocations don't pay for the requests/BeautifulSoup/Twilio/
+# Google SDK import trees they never use
 
 # Set up logger
 logger = setup_logger('main_agent')
 
+# Decoded sample listings, keyed by (path, mtime) so repeated dry runs in
+# one process skip re-reading and re-parsing the file
+_SAMPLE_CACHE = {}
+
+def _load_sample_listings(sample_data_path):
+    """
+    Load and cache the dry-run sample listings file.
+
+    Args:
+        sample_data_path (str): Path to the sample listings JSON file.
+
+    Returns:
+        list: Sample listing dicts (fresh shallow copies, safe to mutate).
+    """
+    key = (sample_data_path, os.path.getmtime(sample_data_path))
+    listings = _SAMPLE_CACHE.get(key)
+    if listings is None:
+        with open(sample_data_path, 'rb') as f:
+            raw = f.read()
+        try:
+            import orjson
+            listings = orjson.loads(raw)
+        except ImportError:
+            import json
+            listings = json.loads(raw)
+        _SAMPLE_CACHE.clear()  # At most one file/version is ever cached
+        _SAMPLE_CACHE[key] = listings
+    # Callers mutate listings (e.g. tagging 'source'), so hand out copies
+    return [dict(listing) for listing in listings]
+
 def main(use_mock=False, dry_run=False):
     """
     Main function to run the car finder agent.
     Orchestrates the entire process from scraping to CRM integration.
-    
+
     Args:
         use_mock (bool): Whether to use mock services instead of real APIs
         dry_run (bool): If True, log actions but don't execute them
-    
+
     Returns:
         int: Exit code (0 for success, 1 for failure)
     """
+    http_session = None
     try:
-        print("\n========= Used Car Lead Generation Agent =========")
-        print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        
+        # Decorative banners only make sense on an interactive terminal;
+        # all status output below goes through the logger's stdout handler
+        if sys.stdout.isatty():
+            print("\n========= Used Car Lead Generation Agent =========")
+            print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+
         logger.info("Starting Used Car Lead Generation Agent")
         if use_mock:
             logger.info("*** USING MOCK SERVICES - NO REAL API CALLS WILL BE MADE ***")
-            print(">>> Running with MOCK SERVICES (no real API calls)")
         if dry_run:
             logger.info("*** DRY RUN MODE - ACTIONS WILL BE LOGGED BUT NOT EXECUTED ***")
-            print(">>> Running in DRY RUN MODE (actions will be logged but not executed)")
-        
+
         # Load configuration
-        print("Loading configuration...")
         logger.info("Loading configuration")
         config = load_config()
-        
+
+        # Read the CRM toggle once per run; is_crm_enabled() re-reads
+        # ui_settings.json on every call, which adds up over a large batch
+        crm_enabled = is_crm_enabled()
+
+        # One pooled HTTP session shared by every component that talks
+        # raw HTTP, so repeated calls to the same host reuse the TCP+TLS
+        # connection instead of re-handshaking each time
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+        http_session = requests.Session()
+        http_session.mount('https://', HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        ))
+
         # Initialize managers
-        print("Initializing services and managers...")
-        logger.info("Initializing managers...")
-        
+        logger.info("Initializing services and managers...")
+
         # If using mock services, set up mock APIs
         if use_mock:
             from utils.mock_services import get_mock_services
             from tests.mock_managers import MockMessagingManager, MockDataManager, MockNotificationManager, MockThryvIntegrator
-            
+
             mock_services = get_mock_services()
             messaging_manager = MockMessagingManager(config, mock_twilio_service=mock_services['twilio'])
             data_manager = MockDataManager(config, mock_sheets_service=mock_services['sheets'])
@@ -66,41 +111,36 @@ def main(use_mock=False, dry_run=False):
             thryv_integrator = MockThryvIntegrator(config, mock_thryv_service=mock_services['thryv'])
         else:
             # Real service initialization
+            from managers.messaging_manager import MessagingManager
+            from managers.data_manager import DataManager
+            from managers.notification_manager import NotificationManager
+            from managers.thryv_integrator import ThryvIntegrator
+
             messaging_manager = MessagingManager(config)
             data_manager = DataManager(config)
             notification_manager = NotificationManager(config, messaging_manager)
-            thryv_integrator = ThryvIntegrator(config)
-        
+            thryv_integrator = ThryvIntegrator(config, session=http_session)
+
         # Verify Thryv authentication (don't block if fails)
-        print("Authenticating with Thryv CRM...")
+        logger.info("Authenticating with Thryv CRM...")
         thryv_auth_success = thryv_integrator.authenticate()
         if not thryv_auth_success:
-            logger.warning("Thryv authentication failed. CRM integration will be skipped.")
-            print("⚠️  Thryv authentication failed. CRM integration will be skipped.")
+            logger.warning("⚠️  Thryv authentication failed. CRM integration will be skipped.")
         else:
-            print("✅ Thryv authentication successful.")
-        
-        # Initialize the Craigslist scraper
-        print("Initializing Craigslist scraper...")
-        logger.info("Initializing Craigslist scraper")
-        craigslist_scraper = CraigslistScraper(config)
-        
+            logger.info("✅ Thryv authentication successful.")
+
         # Scrape listings
         if dry_run:
-            logger.info("DRY RUN: Would scrape Craigslist listings")
-            print("DRY RUN: Loading sample listings instead of scraping...")
+            logger.info("DRY RUN: Loading sample listings instead of scraping...")
             # Use sample data in dry run mode
-            import json
             sample_data_path = os.path.join('tests', 'sample_data', 'sample_listings.json')
             try:
                 if os.path.exists(sample_data_path):
-                    with open(sample_data_path, 'r') as f:
-                        listings = json.load(f)
-                        logger.info(f"Loaded {len(listings)} sample listings")
-                        print(f"✅ Loaded {len(listings)} sample listings")
+                    listings = _load_sample_listings(sample_data_path)
+                    logger.info("✅ Loaded %d sample listings", len(listings))
                 else:
                     # Create some dummy listings if sample file doesn't exist
-                    print("⚠️  Sample data file not found. Creating dummy listings...")
+                    logger.warning("⚠️  Sample data file not found. Creating dummy listings...")
                     listings = [
                         {
                             'title': '2020 Toyota Camry - Low Miles!',
@@ -125,55 +165,54 @@ def main(use_mock=False, dry_run=False):
                             'date_posted': '2023-05-14'
                         }
                     ]
-                    logger.info(f"Created {len(listings)} dummy listings")
-                    print(f"✅ Created {len(listings)} dummy listings")
+                    logger.info("✅ Created %d dummy listings", len(listings))
             except Exception as e:
-                logger.error(f"Error loading sample data: {str(e)}")
-                print(f"❌ Error loading sample data: {str(e)}")
+                logger.error("❌ Error loading sample data: %s", e)
                 listings = []
         else:
-            logger.info("Scraping Craigslist listings")
-            print("Scraping Craigslist for car listings... (this may take a few minutes)")
-            print("Searches configured for vehicles from year", config.get('scraper', {}).get('min_vehicle_year', 'N/A'), "and newer")
+            # Initialize the Craigslist scraper (imported here so dry runs
+            # skip the requests/BeautifulSoup import tree entirely)
+            from scrapers.craigslist_scraper import CraigslistScraper
+            logger.info("Initializing Craigslist scraper")
+            craigslist_scraper = CraigslistScraper(config, session=http_session)
+
+            logger.info("Scraping Craigslist for car listings... (this may take a few minutes)")
+            logger.info("Searches configured for vehicles from year %s and newer",
+                        config.get('scraper', {}).get('min_vehicle_year', 'N/A'))
             listings = craigslist_scraper.scrape_listings()
-            print(f"✅ Scraping complete!")
-        
+            logger.info("✅ Scraping complete!")
+
         # Add source to listings
         for listing in listings:
             listing['source'] = 'Craigslist'
-            
-        logger.info(f"Found {len(listings)} raw listings from Craigslist")
-        print(f"Found {len(listings)} raw listings from Craigslist")
-        
+
+        logger.info("Found %d raw listings from Craigslist", len(listings))
+
         # Process and store new leads
         if listings:
             if dry_run:
-                logger.info(f"DRY RUN: Would append {len(listings)} leads to Google Sheet")
-                print(f"DRY RUN: Would append {len(listings)} leads to Google Sheet")
+                logger.info("DRY RUN: Would append %d leads to Google Sheet", len(listings))
                 # Log a few sample listings
                 for i, listing in enumerate(listings[:3]):
-                    logger.info(f"Sample listing {i+1}: {listing.get('title')} - ${listing.get('price')}")
-                    print(f"   - {listing.get('title')} - ${listing.get('price')}")
+                    logger.info("Sample listing %d: %s - $%s", i + 1, listing.get('title'), listing.get('price'))
                 if len(listings) > 3:
-                    logger.info(f"...and {len(listings) - 3} more listings")
-                    print(f"   - ...and {len(listings) - 3} more listings")
+                    logger.info("...and %d more listings", len(listings) - 3)
                 success = True
             else:
                 logger.info("Appending new leads to Google Sheet...")
-                print("Appending new leads to Google Sheet...")
                 success = data_manager.append_leads_to_sheet(listings)
                 if success:
-                    print("✅ Leads added to Google Sheet successfully")
+                    logger.info("✅ Leads added to Google Sheet successfully")
                 else:
-                    print("❌ Failed to add leads to Google Sheet")
-            
+                    logger.error("❌ Failed to add leads to Google Sheet")
+
             if success:
                 logger.info("Leads processed and potentially added to Google Sheet.")
                 # Get all leads from the sheet to find new ones and their row indices
-                
+
                 if dry_run:
                     # In dry run mode, just use our listings as "all leads"
-                    print("DRY RUN: Using sample listings as stored leads")
+                    logger.info("DRY RUN: Using sample listings as stored leads")
                     all_leads = []
                     for i, listing in enumerate(listings):
                         lead = listing.copy()
@@ -181,160 +220,174 @@ def main(use_mock=False, dry_run=False):
                         lead['_row_index'] = i + 2  # +2 because row 1 is header
                         all_leads.append(lead)
                 else:
-                    print("Retrieving all leads from Google Sheet...")
+                    logger.info("Retrieving all leads from Google Sheet...")
                     all_leads = data_manager.get_all_leads()
-                    print(f"Retrieved {len(all_leads)} leads from Google Sheet")
-                
+                    logger.info("Retrieved %d leads from Google Sheet", len(all_leads))
+
                 # Find new leads by matching against listings (using listing_url as unique identifier)
                 listing_urls = {lead.get('listing_url'): lead for lead in listings}
-                
-                processed_count = 0
-                total_to_process = 0
-                
-                # First, count how many leads need processing
-                for lead in all_leads:
-                    listing_url = lead.get('listing_url')
-                    if listing_url in listing_urls and not lead.get('thryv_status'):
-                        total_to_process += 1
-                
-                if total_to_process > 0:
-                    print(f"\nProcessing {total_to_process} new leads:")
-                    
+
+                # Sheet status writes are collected here and flushed in one
+                # batchUpdate after the loop instead of one write per lead
+                pending_status_updates = []
+
+                # Single pass over the sheet rows: index the unprocessed leads
+                # from this scrape by URL with their row numbers
+                new_lead_rows = {}
                 for index, lead in enumerate(all_leads, start=2):  # Start at 2 because row 1 is header
                     listing_url = lead.get('listing_url')
-                    
-                    # If this lead is in our new listings and hasn't been processed for Thryv
                     if listing_url in listing_urls and not lead.get('thryv_status'):
-                        current_lead = listing_urls[listing_url]
-                        logger.info(f"Processing lead: {current_lead.get('title')}")
-                        processed_count += 1
-                        print(f"\n({processed_count}/{total_to_process}) Processing: {current_lead.get('title')}")
-                        
-                        # 1. Attempt to send SMS to seller
-                        sms_to_seller_status = "Not Attempted"
-                        if current_lead.get('phone_number'):
-                            if dry_run:
-                                logger.info(f"DRY RUN: Would send SMS to seller for: {current_lead.get('title')}")
-                                print(f"   DRY RUN: Would send SMS to seller at {current_lead.get('phone_number')}")
-                                sms_to_seller_status = "Would Send (Dry Run)"
-                            else:
-                                logger.info(f"Attempting to send SMS to seller for: {current_lead.get('title')}")
-                                print(f"   Sending SMS to seller at {current_lead.get('phone_number')}...")
-                                inquiry_result = messaging_manager.send_listing_inquiry(current_lead)
-                                if inquiry_result:
-                                    sms_to_seller_status = "Sent Successfully"
-                                    logger.info(f"SMS to seller for {current_lead.get('title')} sent.")
-                                    print(f"   ✅ SMS sent successfully")
+                        new_lead_rows[listing_url] = index
+
+                total_to_process = len(new_lead_rows)
+
+                async def _process_new_leads():
+                    # Each lead's SMS, client notification and Thryv create are
+                    # network-bound, so leads are processed concurrently with a
+                    # bounded fan-out; blocking manager calls run in the
+                    # default thread pool.
+                    sem = asyncio.Semaphore(10)
+                    loop = asyncio.get_running_loop()
+
+                    async def process_lead(seq, listing_url, index):
+                        async with sem:
+                            current_lead = listing_urls[listing_url]
+                            # Bind the hot fields once; the per-lead block
+                            # otherwise repeats the same dict lookups ~10x
+                            title = current_lead.get('title')
+                            phone = current_lead.get('phone_number')
+                            logger.info("(%d/%d) Processing lead: %s", seq, total_to_process, title)
+
+                            # 1. Attempt to send SMS to seller
+                            sms_to_seller_status = "Not Attempted"
+                            if phone:
+                                if dry_run:
+                                    logger.info("DRY RUN: Would send SMS to seller at %s for: %s", phone, title)
+                                    sms_to_seller_status = "Would Send (Dry Run)"
                                 else:
-                                    sms_to_seller_status = "Failed to Send"
-                                    logger.warning(f"SMS to seller for {current_lead.get('title')} failed.")
-                                    print(f"   ❌ Failed to send SMS")
-                        else:
-                            sms_to_seller_status = "No Phone Number"
-                            logger.info(f"No phone number found for seller of: {current_lead.get('title')}")
-                            print(f"   ⚠️ No phone number found for seller")
-                        
-                        # 2. Notify client about the new lead
-                        if dry_run:
-                            logger.info(f"DRY RUN: Would notify client about lead: {current_lead.get('title')}")
-                            print(f"   DRY RUN: Would notify client about this lead")
-                        else:
-                            logger.info(f"Notifying client about lead: {current_lead.get('title')}")
-                            print(f"   Notifying client about this lead...")
-                            notification_result = notification_manager.notify_client_about_lead(current_lead, sms_to_seller_status)
-                            if notification_result:
-                                print(f"   ✅ Client notification sent successfully")
+                                    logger.info("Sending SMS to seller at %s for: %s", phone, title)
+                                    inquiry_result = await loop.run_in_executor(
+                                        None, messaging_manager.send_listing_inquiry, current_lead)
+                                    if inquiry_result:
+                                        sms_to_seller_status = "Sent Successfully"
+                                        logger.info("✅ SMS to seller for %s sent.", title)
+                                    else:
+                                        sms_to_seller_status = "Failed to Send"
+                                        logger.warning("❌ SMS to seller for %s failed.", title)
                             else:
-                                print(f"   ⚠️ Client notification may have failed")
-                        
-                        # 3. Send to Thryv CRM
-                        if thryv_auth_success and is_crm_enabled():
+                                sms_to_seller_status = "No Phone Number"
+                                logger.info("⚠️ No phone number found for seller of: %s", title)
+
+                            # 2. Notify client about the new lead (depends on the SMS outcome)
                             if dry_run:
-                                logger.info(f"DRY RUN: Would send lead to Thryv CRM: {current_lead.get('title')}")
-                                print(f"   DRY RUN: Would send lead to Thryv CRM")
-                                # Simulate success/failure scenarios
-                                import random
-                                if random.random() < 0.9:  # 90% success rate in dry run
-                                    thryv_success = True
-                                    thryv_result = f"DRYRUN-{uuid.uuid4().hex[:8]}"
-                                    logger.info(f"DRY RUN: Lead would be sent to Thryv with ID: {thryv_result}")
-                                    print(f"   DRY RUN: Lead would be sent to Thryv with ID: {thryv_result}")
-                                else:
-                                    thryv_success = False
-                                    thryv_result = "Simulated API error"
-                                    logger.warning(f"DRY RUN: Lead would fail to send to Thryv: {thryv_result}")
-                                    print(f"   DRY RUN: Lead would fail to send to Thryv: {thryv_result}")
+                                logger.info("DRY RUN: Would notify client about lead: %s", title)
                             else:
-                                logger.info(f"Sending lead to Thryv CRM: {current_lead.get('title')}")
-                                print(f"   Sending lead to Thryv CRM...")
-                                thryv_success, thryv_result = thryv_integrator.create_thryv_lead(current_lead)
-                            
-                            if thryv_success:
-                                # Update Google Sheet with Thryv status
-                                if dry_run:
-                                    logger.info(f"DRY RUN: Would update Google Sheet with Thryv status: Sent to Thryv, ID: {thryv_result}")
-                                    print(f"   DRY RUN: Would update Google Sheet with Thryv status")
+                                logger.info("Notifying client about lead: %s", title)
+                                notification_result = await loop.run_in_executor(
+                                    None, notification_manager.notify_client_about_lead,
+                                    current_lead, sms_to_seller_status)
+                                if notification_result:
+                                    logger.info("✅ Client notification sent successfully")
                                 else:
-                                    data_manager.update_thryv_status(index, "Sent to Thryv", thryv_result)
-                                    logger.info(f"Lead sent to Thryv with ID: {thryv_result}")
-                                    print(f"   ✅ Lead sent to Thryv with ID: {thryv_result}")
-                            else:
-                                # Update Google Sheet with error status
+                                    logger.warning("⚠️ Client notification may have failed")
+
+                            # 3. Send to Thryv CRM
+                            if thryv_auth_success and crm_enabled:
                                 if dry_run:
-                                    logger.info(f"DRY RUN: Would update Google Sheet with Thryv error status: {thryv_result}")
-                                    print(f"   DRY RUN: Would update Google Sheet with Thryv error status")
+                                    logger.info("DRY RUN: Would send lead to Thryv CRM: %s", title)
+                                    # Simulate success/failure scenarios
+                                    import random
+                                    import uuid
+                                    if random.random() < 0.9:  # 90% success rate in dry run
+                                        thryv_success = True
+                                        thryv_result = f"DRYRUN-{uuid.uuid4().hex[:8]}"
+                                        logger.info("DRY RUN: Lead would be sent to Thryv with ID: %s", thryv_result)
+                                    else:
+                                        thryv_success = False
+                                        thryv_result = "Simulated API error"
+                                        logger.warning("DRY RUN: Lead would fail to send to Thryv: %s", thryv_result)
+                                else:
+                                    logger.info("Sending lead to Thryv CRM: %s", title)
+                                    thryv_success, thryv_result = await loop.run_in_executor(
+                                        None, thryv_integrator.create_thryv_lead, current_lead)
+
+                                if thryv_success:
+                                    # Queue the Google Sheet Thryv status update
+                                    if dry_run:
+                                        logger.info("DRY RUN: Would update Google Sheet with Thryv status: Sent to Thryv, ID: %s", thryv_result)
+                                    else:
+                                        pending_status_updates.append({
+                                            'row_index': index,
+                                            'thryv_status': "Sent to Thryv",
+                                            'thryv_lead_id': thryv_result
+                                        })
+                                        logger.info("✅ Lead sent to Thryv with ID: %s", thryv_result)
                                 else:
-                                    data_manager.update_thryv_status(index, "Error: Failed to send to Thryv")
-                                    logger.warning(f"Failed to send lead to Thryv: {thryv_result}")
-                                    print(f"   ❌ Failed to send lead to Thryv: {thryv_result}")
-                        elif not thryv_auth_success and is_crm_enabled():
-                            logger.warning(f"Thryv authentication failed, cannot send lead: {current_lead.get('title')}")
-                            print(f"   ⚠️ Thryv authentication failed, cannot send lead.")
-                            thryv_status = "Error (Auth Failed)"
-                        else:
-                            logger.info("Thryv CRM integration skipped as it's disabled or auth failed.")
-                            # No print here to avoid redundancy if already printed above for disabled case
-                            if not is_crm_enabled():
-                                thryv_status = "Skipped (Disabled)"
-                            else: # This case should ideally not be hit if logic is sound
-                                thryv_status = "Skipped (Unknown Reason)"
-                        
-                        # 4. Update Google Sheet with Thryv status
-                        if not dry_run:
-                            data_manager.update_thryv_status(index, thryv_status)
-                            logger.info(f"Lead status updated to: {thryv_status}")
-                            print(f"   ✅ Lead status updated to: {thryv_status}")
-                    
+                                    # Queue the Google Sheet error status update
+                                    if dry_run:
+                                        logger.info("DRY RUN: Would update Google Sheet with Thryv error status: %s", thryv_result)
+                                    else:
+                                        pending_status_updates.append({
+                                            'row_index': index,
+                                            'thryv_status': "Error: Failed to send to Thryv"
+                                        })
+                                        logger.warning("❌ Failed to send lead to Thryv: %s", thryv_result)
+                            elif not thryv_auth_success and crm_enabled:
+                                logger.warning("⚠️ Thryv authentication failed, cannot send lead: %s", title)
+                                if not dry_run:
+                                    pending_status_updates.append({
+                                        'row_index': index,
+                                        'thryv_status': "Error (Auth Failed)"
+                                    })
+                            else:
+                                logger.info("Thryv CRM integration skipped as it's disabled or auth failed.")
+                                if not dry_run:
+                                    pending_status_updates.append({
+                                        'row_index': index,
+                                        'thryv_status': "Skipped (Disabled)"
+                                    })
+
+                    await asyncio.gather(*(
+                        process_lead(seq, url, idx)
+                        for seq, (url, idx) in enumerate(new_lead_rows.items(), start=1)
+                    ))
+
+                if total_to_process > 0:
+                    logger.info("Processing %d new leads:", total_to_process)
+                    asyncio.run(_process_new_leads())
+
+                # 4. Flush all queued Thryv status updates in one batch write
+                if pending_status_updates:
+                    if data_manager.batch_update_thryv_statuses(pending_status_updates):
+                        logger.info("✅ Updated Thryv status for %d leads in the sheet", len(pending_status_updates))
+                    else:
+                        logger.error("❌ Failed to batch update Thryv statuses in the sheet.")
+
                 if total_to_process == 0:
-                    print("\nNo new leads to process in this run.")
+                    logger.info("No new leads to process in this run.")
             else:
-                logger.error("Failed to append leads to Google Sheet.")
-                print("❌ Failed to append leads to Google Sheet.")
+                logger.error("❌ Failed to append leads to Google Sheet.")
         else:
-            logger.info("No listings found in this scrape cycle.")
-            print("\nNo new listings found in this scrape cycle.")
-            
-        logger.info("Agent completed successfully")
-        print("\n✅ Agent completed successfully")
-        print("\n============== Operation Complete ==============\n")
+            logger.info("No new listings found in this scrape cycle.")
+
+        logger.info("✅ Agent completed successfully")
         return 0
-        
+
     except Exception as e:
-        logger.error(f"Error in main process: {str(e)}")
-        logger.error(traceback.format_exc())
-        print(f"\n❌ ERROR: {str(e)}")
-        print("Check the logs for more details.")
-        print("\n============== Operation Failed ===============\n")
+        logger.exception("Error in main process: %s", e)
         return 1
+    finally:
+        if http_session is not None:
+            http_session.close()
 
 if __name__ == "__main__":
     # Set up argument parser
     parser = argparse.ArgumentParser(description='Run the Used Car Lead Generation Agent')
     parser.add_argument('--mock', action='store_true', help='Use mock services instead of real APIs')
     parser.add_argument('--dry-run', action='store_true', help='Log actions but do not execute them')
-    
+
     args = parser.parse_args()
-    
+
     # Run the main function
     exit_code = main(use_mock=args.mock, dry_run=args.dry_run)
-    sys.exit(exit_code) 
\ No newline at end of file
+    sys.exit(exit_code)
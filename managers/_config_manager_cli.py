@@ -0,0 +1,80 @@
+"""
+Manual exercise script for config_manager, kept out of the importable
+module so its body is not compiled into config_manager's bytecode on every
+import. Run directly: python -m managers._config_manager_cli
+"""
+
+import os
+
+from managers.config_manager import (
+    CONFIGURABLE_SETTINGS,
+    DOTENV_PATH,
+    Setting,
+    _CONFIGURABLE_SETTINGS,
+    _ENV_SNAPSHOT,
+    _parse_env,
+    _write_env,
+    get_all_configurable_settings_with_values,
+    get_config_value,
+    update_multiple_config_values,
+)
+
+
+def main():
+    print("Configurable Settings Test:")
+    settings = get_all_configurable_settings_with_values()
+    for k, v in settings.items():
+        print(f"- {k}: Current Value='{v['current_value']}' (Type: {v['type']}, Sensitive: {v['sensitive']}, Options: {v.get('options', 'N/A')}) Desc: {v['description']}")
+
+    print("\nTesting update (example - MIN_VEHICLE_YEAR to 2020):")
+    # Ensure MIN_VEHICLE_YEAR is in CONFIGURABLE_SETTINGS for this test to run
+    if 'MIN_VEHICLE_YEAR' in CONFIGURABLE_SETTINGS:
+        update_results = update_multiple_config_values({'MIN_VEHICLE_YEAR': '2020', 'LOG_LEVEL': 'DEBUG', 'MADE_UP_KEY': 'test'})
+        print("Update Results:", update_results)
+
+        print("\nFetching MIN_VEHICLE_YEAR and LOG_LEVEL again:")
+        print(f"MIN_VEHICLE_YEAR: {get_config_value('MIN_VEHICLE_YEAR')}")
+        print(f"LOG_LEVEL: {get_config_value('LOG_LEVEL')}")
+    else:
+        print("MIN_VEHICLE_YEAR not in CONFIGURABLE_SETTINGS, skipping update test.")
+
+    # Test creating/updating a sensitive key
+    if 'TEST_SENSITIVE_KEY' not in CONFIGURABLE_SETTINGS:
+        # CONFIGURABLE_SETTINGS itself is a read-only proxy; the test key
+        # goes into the backing dict
+        _CONFIGURABLE_SETTINGS['TEST_SENSITIVE_KEY'] = Setting(
+            description="A test sensitive key.",
+            type='string',
+            sensitive=True
+        )
+        print("Added TEST_SENSITIVE_KEY to CONFIGURABLE_SETTINGS for this test run.")
+
+    print("\nTesting update for TEST_SENSITIVE_KEY:")
+    update_results_sensitive = update_multiple_config_values({'TEST_SENSITIVE_KEY': 'mysecretvalue'})
+    print("Sensitive Update Results:", update_results_sensitive)
+    print(f"TEST_SENSITIVE_KEY (from get_config_value): {get_config_value('TEST_SENSITIVE_KEY')}")
+
+    settings_after_sensitive_update = get_all_configurable_settings_with_values()
+    print(f"TEST_SENSITIVE_KEY (displayed): {settings_after_sensitive_update.get('TEST_SENSITIVE_KEY', {}).get('current_value')}")
+
+    print("\nTesting 'no change' for TEST_SENSITIVE_KEY by passing '********':")
+    update_results_nochange = update_multiple_config_values({'TEST_SENSITIVE_KEY': '********'})
+    print("No Change Sensitive Update Results:", update_results_nochange)
+    print(f"TEST_SENSITIVE_KEY (should be 'mysecretvalue'): {get_config_value('TEST_SENSITIVE_KEY')}")
+
+    print("\nTesting clearing TEST_SENSITIVE_KEY by passing empty string:")
+    update_results_clear = update_multiple_config_values({'TEST_SENSITIVE_KEY': ''})
+    print("Clear Sensitive Update Results:", update_results_clear)
+    print(f"TEST_SENSITIVE_KEY (should be None or empty): {get_config_value('TEST_SENSITIVE_KEY')}")
+
+    # Clean up the test key from .env if it was added
+    _cleanup_values = _parse_env(DOTENV_PATH)
+    _cleanup_values.pop('TEST_SENSITIVE_KEY', None)
+    _write_env(DOTENV_PATH, _cleanup_values)
+    _ENV_SNAPSHOT.pop('TEST_SENSITIVE_KEY', None)
+    os.environ.pop('TEST_SENSITIVE_KEY', None)
+    print("Cleaned up TEST_SENSITIVE_KEY from .env")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,124 +1,249 @@
+import logging
 import os
-from typing import Dict, Any, Optional, List
-from dotenv import load_dotenv, find_dotenv, get_key, set_key
+import tempfile
+import threading
+import types
+from typing import Dict, Any, NamedTuple, Optional, List
+
+_log = logging.getLogger(__name__)
+
+def _parse_env(path: str) -> Dict[str, str]:
+    """
+    Parse a .env file into a dict in one linear pass.
+
+    Handles comments, blank lines, an optional 'export ' prefix, and
+    matched surrounding quotes (with backslash escapes inside double
+    quotes). Much cheaper than python-dotenv's regex-based parser, which
+    matters on serverless cold starts.
+
+    Args:
+        path (str): Path to the .env file.
+
+    Returns:
+        Dict[str, str]: Parsed key/value pairs.
+    """
+    values: Dict[str, str] = {}
+    with open(path, 'rb') as f:
+        text = f.read().decode('utf-8')
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        if line.startswith('export '):
+            line = line[7:]
+        key, _, value = line.partition('=')
+        key = key.strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+            quote = value[0]
+            value = value[1:-1]
+            if quote == '"':
+                value = value.replace('\\"', '"').replace('\\\\', '\\')
+        values[key] = value
+    return values
+
+def _write_env(path: str, values: Dict[str, str]) -> None:
+    """
+    Write key/value pairs to a .env file atomically.
+
+    Emits KEY="value" lines with escaped quotes/backslashes to a temp file
+    in the same directory, then swaps it in with os.replace so a crash
+    mid-write cannot truncate the config.
+
+    Args:
+        path (str): Path to the .env file.
+        values (Dict[str, str]): Key/value pairs to write.
+    """
+    env_dir = os.path.dirname(path) or '.'
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile('w', dir=env_dir, prefix='.env.', delete=False, buffering=65536) as tmp_file:
+            tmp_path = tmp_file.name
+            for key, value in values.items():
+                escaped = (value or '').replace('\\', '\\\\').replace('"', '\\"')
+                tmp_file.write(f'{key}="{escaped}"\n')
+            # One fsync for the whole batch so the rename publishes
+            # fully-durable contents
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+# In-memory snapshot of the .env file, parsed exactly once at import.
+# Reads hit this dict; writes in update_multiple_config_values keep it in
+# sync, so the file is never re-parsed on the read path.
+_ENV_SNAPSHOT: Dict[str, str] = {}
+
+# Serializes snapshot refreshes and .env writes; the Flask settings UI is
+# served from multiple threads
+_ENV_LOCK = threading.Lock()
 
 # Define the path to the .env file
 # This assumes config_manager.py is in a 'managers' subdirectory of the project root.
 DOTENV_PATH = None
 try:
     PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    # Attempt to find .env in the project root or current working directory.
-    # Do not raise an error if not found, and do not create it.
-    found_dotenv_path = find_dotenv(filename='.env', usecwd=True, raise_error_if_not_found=False)
-
-    if found_dotenv_path and os.path.exists(found_dotenv_path):
-        DOTENV_PATH = found_dotenv_path
-        load_dotenv(DOTENV_PATH, override=True) # Load existing .env file
-        print(f"Loaded .env file from: {DOTENV_PATH}") # For debugging
-    else:
-        # If .env is not found, DOTENV_PATH remains None.
-        # The application will rely on environment variables set externally (e.g., by Vercel).
-        print(".env file not found. Relying on system-set environment variables.")
-        # Attempt to load from process environment anyway, in case they are already set
-        load_dotenv(override=True)
+    # The .env file lives in the project root, which is already known from
+    # __file__ — a single existence check beats find_dotenv's directory walk
+    _candidate_dotenv_path = os.path.join(PROJECT_ROOT, '.env')
 
+    if os.path.exists(_candidate_dotenv_path):
+        DOTENV_PATH = _candidate_dotenv_path
+        _ENV_SNAPSHOT = _parse_env(DOTENV_PATH)
+        # Mirror into the process environment (matches the old
+        # load_dotenv(override=True) behavior for os.getenv consumers)
+        os.environ.update(_ENV_SNAPSHOT)
+        _log.debug("Loaded .env file from: %s", DOTENV_PATH)
+    else:
+        # If .env is not found, DOTENV_PATH remains None. os.environ already
+        # holds any externally-set variables (e.g., from Vercel), so there is
+        # nothing further to load.
+        _log.debug(".env file not found. Relying on system-set environment variables.")
 
 except Exception as e:
-    # Fallback if path resolution or loading fails (e.g., in some execution contexts)
-    print(f"Error during .env file processing: {e}. Relying on system-set environment variables.")
-    # Attempt to load from process environment as a last resort
-    load_dotenv(override=True)
+    # Fallback if path resolution or loading fails (e.g., in some execution
+    # contexts); os.environ already holds externally-set variables.
+    _log.warning("Error during .env file processing: %s. Relying on system-set environment variables.", e)
+
+
+class Setting(NamedTuple):
+    """Schema for one UI-configurable setting. A slotted tuple is smaller
+    than a per-entry dict and gives fixed-offset attribute access in the
+    settings-page loop. options_set mirrors options as a frozenset for
+    O(1) validation of select types."""
+    description: str
+    type: str
+    sensitive: bool
+    options: tuple = ()
+    options_set: frozenset = frozenset()
 
 
 # Define configurations that can be managed via UI
-# Structure: 'ENV_VAR_NAME': {'description': 'Helpful note', 'type': 'string'/'int'/'bool'/'list', 'sensitive': True/False, 'options': [] (for type='select')}
-CONFIGURABLE_SETTINGS: Dict[str, Dict[str, Any]] = {
-    'GOOGLE_SHEET_ID': {
-        'description': "The ID of the Google Sheet used to store leads. If left blank or set to 'your_google_sheet_id', the system may attempt to create a new sheet when DataManager initializes. Update this with the ID of an existing sheet if you have one.",
-        'type': 'string',
-        'sensitive': False
-    },
-    'MIN_VEHICLE_YEAR': {
-        'description': "The minimum year for vehicles to be considered a lead (e.g., 2018). Leads for vehicles older than this year will be skipped.",
-        'type': 'int',
-        'sensitive': False
-    },
-    'LOG_LEVEL': {
-        'description': "Set the application-wide logging verbosity. 'DEBUG' is most verbose, 'ERROR' is least.",
-        'type': 'select',
-        'options': ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
-        'sensitive': False
-    },
-    'SCRAPER_REQUEST_TIMEOUT_SECONDS': {
-        'description': "Maximum time (in seconds) to wait for a response when scraping websites.",
-        'type': 'int',
-        'sensitive': False
-    },
-    'SCRAPER_DELAY_MIN_SECONDS': {
-        'description': "Minimum random delay (in seconds) between scraping requests to avoid overloading target websites.",
-        'type': 'float', # Using float for potentially sub-second precision
-        'sensitive': False
-    },
-    'SCRAPER_DELAY_MAX_SECONDS': {
-        'description': "Maximum random delay (in seconds) between scraping requests.",
-        'type': 'float',
-        'sensitive': False
-    },
-    'THRYV_API_KEY': {
-        'description': "Your API Key for Thryv integration. Used to send leads to Thryv. (Sensitive)",
-        'type': 'string',
-        'sensitive': True
-    },
-    'THRYV_BUSINESS_ID': {
-        'description': "Your Business ID for Thryv. Necessary for API interactions.",
-        'type': 'string',
-        'sensitive': False
-    },
-    'TWILIO_ACCOUNT_SID': {
-        'description': "Your Twilio Account SID, used for sending SMS notifications about new leads. (Sensitive)",
-        'type': 'string',
-        'sensitive': True
-    },
-    'TWILIO_AUTH_TOKEN': {
-        'description': "Your Twilio Auth Token. Kept highly confidential. (Sensitive)",
-        'type': 'string',
-        'sensitive': True
-    },
-    'TWILIO_PHONE_NUMBER': {
-        'description': "The Twilio phone number (in E.164 format, e.g., +12345678900) from which SMS notifications will be sent.",
-        'type': 'string',
-        'sensitive': False
-    },
-    'USER_EMAIL_ADDRESS': {
-        'description': "Primary email address for notifications or user identification within the system.",
-        'type': 'string',
-        'sensitive': False
-    }
+_CONFIGURABLE_SETTINGS: Dict[str, Setting] = {
+    'GOOGLE_SHEET_ID': Setting(
+        description="The ID of the Google Sheet used to store leads. If left blank or set to 'your_google_sheet_id', the system may attempt to create a new sheet when DataManager initializes. Update this with the ID of an existing sheet if you have one.",
+        type='string',
+        sensitive=False
+    ),
+    'MIN_VEHICLE_YEAR': Setting(
+        description="The minimum year for vehicles to be considered a lead (e.g., 2018). Leads for vehicles older than this year will be skipped.",
+        type='int',
+        sensitive=False
+    ),
+    'LOG_LEVEL': Setting(
+        description="Set the application-wide logging verbosity. 'DEBUG' is most verbose, 'ERROR' is least.",
+        type='select',
+        options=('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'),
+        sensitive=False
+    ),
+    'SCRAPER_REQUEST_TIMEOUT_SECONDS': Setting(
+        description="Maximum time (in seconds) to wait for a response when scraping websites.",
+        type='int',
+        sensitive=False
+    ),
+    'SCRAPER_DELAY_MIN_SECONDS': Setting(
+        description="Minimum random delay (in seconds) between scraping requests to avoid overloading target websites.",
+        type='float', # Using float for potentially sub-second precision
+        sensitive=False
+    ),
+    'SCRAPER_DELAY_MAX_SECONDS': Setting(
+        description="Maximum random delay (in seconds) between scraping requests.",
+        type='float',
+        sensitive=False
+    ),
+    'THRYV_API_KEY': Setting(
+        description="Your API Key for Thryv integration. Used to send leads to Thryv. (Sensitive)",
+        type='string',
+        sensitive=True
+    ),
+    'THRYV_BUSINESS_ID': Setting(
+        description="Your Business ID for Thryv. Necessary for API interactions.",
+        type='string',
+        sensitive=False
+    ),
+    'TWILIO_ACCOUNT_SID': Setting(
+        description="Your Twilio Account SID, used for sending SMS notifications about new leads. (Sensitive)",
+        type='string',
+        sensitive=True
+    ),
+    'TWILIO_AUTH_TOKEN': Setting(
+        description="Your Twilio Auth Token. Kept highly confidential. (Sensitive)",
+        type='string',
+        sensitive=True
+    ),
+    'TWILIO_PHONE_NUMBER': Setting(
+        description="The Twilio phone number (in E.164 format, e.g., +12345678900) from which SMS notifications will be sent.",
+        type='string',
+        sensitive=False
+    ),
+    'USER_EMAIL_ADDRESS': Setting(
+        description="Primary email address for notifications or user identification within the system.",
+        type='string',
+        sensitive=False
+    )
     # Add more settings here based on your application's .env variables
 }
 
+# Precompute O(1) membership sets for select-type options once at import
+for _key, _setting in _CONFIGURABLE_SETTINGS.items():
+    if _setting.options:
+        _CONFIGURABLE_SETTINGS[_key] = _setting._replace(options_set=frozenset(_setting.options))
+del _key, _setting
+
+# Read-only view shared across the app; the schema must not be mutated at
+# runtime, and a proxy makes accidental writes fail loudly
+CONFIGURABLE_SETTINGS = types.MappingProxyType(_CONFIGURABLE_SETTINGS)
+
+# Mask shown (and accepted back as "unchanged") for sensitive values
+_MASK = "********"
+
+# (mtime_ns, built settings dict) pair for get_all_configurable_settings_with_values;
+# values are masked at build time so the cached dict can be returned as-is
+_SETTINGS_CACHE: Optional[tuple] = None
+
 def get_config_value(key_name: str) -> Optional[str]:
     """
-    Retrieves a configuration value from the .env file.
-    This function reloads from .env each time to ensure freshness if .env is edited externally,
-    though set_key also reloads internally.
+    Retrieves a configuration value.
+
+    Reads from the in-memory _ENV_SNAPSHOT built once at import, falling
+    back to os.environ for variables set externally (e.g. by Vercel).
+    This makes lookups an O(1) dict read instead of a full .env re-parse
+    per key (python-dotenv's get_key re-opens and re-parses the file on
+    every call). Writes go through update_multiple_config_values, which
+    updates the snapshot in place, so it stays authoritative.
 
     Args:
         key_name (str): The name of the environment variable.
-        
+
     Returns:
         Optional[str]: The value of the environment variable, or None if not found.
     """
-    # Ensure DOTENV_PATH is valid and load_dotenv has been called
-    if not DOTENV_PATH or not os.path.exists(DOTENV_PATH):
-        # This case should ideally be handled by the initial load, but as a safeguard:
-        # print(f"Warning: .env file path '{DOTENV_PATH}' not found when getting key '{key_name}'.")
-        return os.getenv(key_name) # Fallback to process environment
+    value = _ENV_SNAPSHOT.get(key_name)
+    return value if value is not None else os.environ.get(key_name)
 
-    # python-dotenv's get_key reads directly from the file.
-    # os.getenv would read from the loaded environment variables.
-    # For UI display, direct file read is fine. For application logic, os.getenv is usually used after initial load.
-    return get_key(DOTENV_PATH, key_name)
+def cfg(key: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Fast config accessor for hot loops.
+
+    Unlike os.getenv, which calls into C to consult the process environment
+    on every read, this is a plain lookup in the in-memory snapshot. Use it
+    at call sites that read the same key repeatedly (scraper delay bounds,
+    minimum vehicle year).
+
+    Args:
+        key (str): The name of the environment variable.
+        default (Optional[str]): Value returned when the key is absent.
+
+    Returns:
+        Optional[str]: The configured value, or the default if not set.
+    """
+    value = _ENV_SNAPSHOT.get(key)
+    if value is not None:
+        return value
+    return os.environ.get(key, default)
 
 def get_all_configurable_settings_with_values() -> Dict[str, Dict[str, Any]]:
     """
@@ -130,52 +255,137 @@ def get_all_configurable_settings_with_values() -> Dict[str, Dict[str, Any]]:
                                    and values are dicts containing 'description', 'current_value', 
                                    'type', 'sensitive', 'options', and 'actual_value_present'.
     """
-    settings_with_values = {}
-    for key, details in CONFIGURABLE_SETTINGS.items():
-        current_value = get_config_value(key) # Get current value from .env
-        
-        display_value = current_value
-        actual_value_present = current_value is not None and current_value != ""
-
-        if details['sensitive'] and actual_value_present:
-            display_value = "********" 
-            
-        settings_with_values[key] = {
-            'description': details['description'],
-            'current_value': display_value,
-            'type': details['type'],
-            'sensitive': details['sensitive'],
-            'options': details.get('options', []), # Include options for select type
-            'actual_value_present': actual_value_present # Helps UI decide placeholder text for sensitive fields
-        }
-    return settings_with_values
-
-def _validate_value(key: str, value: str, details: Dict[str, Any]) -> bool:
-    """Helper to validate value based on type."""
-    setting_type = details['type']
-    if value is None or value == "": # Allow clearing a value
-        return True
+    global _SETTINGS_CACHE
 
-    if setting_type == 'int':
+    # The built result is cached against the .env mtime, so repeated
+    # settings-page renders cost one stat() instead of a full rebuild
+    mtime_ns = None
+    if DOTENV_PATH:
         try:
-            int(value)
-        except ValueError:
-            print(f"Validation Error: '{key}' value '{value}' is not a valid integer.")
-            return False
-    elif setting_type == 'float':
+            mtime_ns = os.stat(DOTENV_PATH).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+    if _SETTINGS_CACHE is not None and _SETTINGS_CACHE[0] == mtime_ns:
+        return _SETTINGS_CACHE[1]
+
+    with _ENV_LOCK:
+        if _SETTINGS_CACHE is not None and mtime_ns is not None:
+            # The file changed behind our back (external edit); refresh the snapshot
+            _ENV_SNAPSHOT.clear()
+            _ENV_SNAPSHOT.update(_parse_env(DOTENV_PATH))
+            _rebuild_typed_cache()
+
+        settings_with_values = {}
+        for key, details in CONFIGURABLE_SETTINGS.items():
+            current_value = get_config_value(key) # Get current value from .env
+
+            # Truthiness covers both the None and empty-string cases in one check
+            actual_value_present = bool(current_value)
+            display_value = _MASK if (details.sensitive and actual_value_present) else current_value
+
+            settings_with_values[key] = {
+                'description': details.description,
+                'current_value': display_value,
+                'type': details.type,
+                'sensitive': details.sensitive,
+                'options': details.options, # Include options for select type
+                'actual_value_present': actual_value_present # Helps UI decide placeholder text for sensitive fields
+            }
+
+        _SETTINGS_CACHE = (mtime_ns, settings_with_values)
+        return settings_with_values
+
+# Accepted spellings for bool settings, precomputed for O(1) membership
+_BOOL_TOKENS = frozenset({'true', 'false', 'yes', 'no', '1', '0', 'on', 'off', ''})
+
+# Canonical form for each accepted bool spelling (empty string saves as false)
+_BOOL_NORMALIZE = {
+    'true': 'true', 'yes': 'true', '1': 'true', 'on': 'true',
+    'false': 'false', 'no': 'false', '0': 'false', 'off': 'false', '': 'false',
+}
+
+def _validate_int(value: str, details: Setting) -> bool:
+    try:
+        int(value)
+        return True
+    except ValueError:
+        return False
+
+def _validate_float(value: str, details: Setting) -> bool:
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+def _validate_bool(value: str, details: Setting) -> bool:
+    return value.lower() in _BOOL_TOKENS
+
+def _validate_select(value: str, details: Setting) -> bool:
+    return value in details.options_set
+
+# Per-type validator dispatch; unknown types (e.g. 'string') validate as-is
+_VALIDATORS = {
+    'int': _validate_int,
+    'float': _validate_float,
+    'bool': _validate_bool,
+    'select': _validate_select,
+}
+
+# Per-type coercers for the typed config cache (parse half of validation)
+_COERCERS = {
+    'int': int,
+    'float': float,
+    'bool': lambda raw: _BOOL_NORMALIZE.get(raw.lower(), raw) == 'true',
+}
+
+# Schema-typed values coerced once per snapshot load, so hot loops read
+# ints/floats/bools directly instead of re-parsing strings on every use
+_ENV_TYPED: Dict[str, Any] = {}
+
+def _rebuild_typed_cache() -> None:
+    """Re-coerce all schema-typed values from the current snapshot."""
+    _ENV_TYPED.clear()
+    for key, setting in CONFIGURABLE_SETTINGS.items():
+        raw = _ENV_SNAPSHOT.get(key)
+        if raw is None:
+            raw = os.environ.get(key)
+        if raw is None or raw == '':
+            continue
+        coercer = _COERCERS.get(setting.type)
         try:
-            float(value)
+            _ENV_TYPED[key] = coercer(raw) if coercer is not None else raw
         except ValueError:
-            print(f"Validation Error: '{key}' value '{value}' is not a valid float.")
-            return False
-    elif setting_type == 'bool':
-        if value.lower() not in ['true', 'false', 'yes', 'no', '1', '0', 'on', 'off', '']:
-            print(f"Validation Error: '{key}' value '{value}' is not a valid boolean representation.")
-            return False
-    elif setting_type == 'select':
-        if value not in details.get('options', []):
-            print(f"Validation Error: '{key}' value '{value}' is not in the allowed options {details.get('options', [])}.")
-            return False
+            # A malformed value in .env stays available in string form
+            _ENV_TYPED[key] = raw
+
+def typed_cfg(key: str, default: Any = None) -> Any:
+    """
+    Return a configurable setting coerced to its schema type.
+
+    int/float/bool settings are parsed once when the snapshot is (re)built,
+    so repeated reads in scraper hot loops cost one dict lookup instead of
+    an int()/float() parse per use.
+
+    Args:
+        key (str): The name of the configurable setting.
+        default (Any): Value returned when the key is absent or unset.
+
+    Returns:
+        Any: The typed value, or the default if not set.
+    """
+    return _ENV_TYPED.get(key, default)
+
+def _validate_value(key: str, value: str, details: Setting) -> bool:
+    """Helper to validate value based on type."""
+    if value is None or value == "": # Allow clearing a value
+        return True
+
+    validator = _VALIDATORS.get(details.type)
+    if validator is not None and not validator(value, details):
+        _log.warning("Validation error: '%s' value '%s' is not a valid '%s' value.", key, value, details.type)
+        return False
     # Add more type checks if needed (e.g., for email format, URL)
     return True
 
@@ -192,151 +402,96 @@ def update_multiple_config_values(settings_to_update: Dict[str, str]) -> Dict[st
         Dict[str, Dict[str, Any]]: Results 도로
                                     {'key': {'success': bool, 'message': str}}
     """
-    results: Dict[str, Dict[str, Any]] = {}
-    something_changed_successfully = False
+    global _SETTINGS_CACHE
 
-    if not DOTENV_PATH or not os.path.exists(DOTENV_PATH):
-        # This should not happen if initial setup worked.
-        for key_to_update in settings_to_update:
-            results[key_to_update] = {'success': False, 'message': f"Configuration file (.env) not found at {DOTENV_PATH}."}
-        return results
+    results: Dict[str, Dict[str, Any]] = {}
+    pending_writes: Dict[str, str] = {}
 
+    # Flag non-configurable keys up front; if nothing valid remains, the
+    # whole validate/write prologue is skipped
+    valid_updates: Dict[str, str] = {}
     for key, new_value in settings_to_update.items():
-        if key not in CONFIGURABLE_SETTINGS:
+        if key in CONFIGURABLE_SETTINGS:
+            valid_updates[key] = new_value
+        else:
             results[key] = {'success': False, 'message': 'This setting is not defined as configurable.'}
-            continue
 
+    if not valid_updates:
+        return results
+
+    # DOTENV_PATH is only set when the file existed at import, and the
+    # atomic rewrite keeps it in place, so no per-call stat is needed.
+    if not DOTENV_PATH:
+        for key_to_update in valid_updates:
+            results[key_to_update] = {'success': False, 'message': f"Configuration file (.env) not found at {DOTENV_PATH}."}
+        return results
+
+    for key, new_value in valid_updates.items():
         details = CONFIGURABLE_SETTINGS[key]
 
         # For sensitive fields, if the submitted value is the mask "********", it means "do not change".
         # This check should happen BEFORE validation.
-        if details['sensitive']:
+        if details.sensitive:
             # Check if a value was actually set for this sensitive key before
             # If user submits "********" for a field that was already set and masked, don't change it.
             # If user submits "********" for a field that was blank, it still means "don't set it / leave blank".
             # The crucial part is not to literally save "********" as the value.
-            current_actual_value = get_key(DOTENV_PATH, key) # Get actual value, not from os.getenv
-            if new_value == "********" and current_actual_value is not None and current_actual_value != "":
+            current_actual_value = _ENV_SNAPSHOT.get(key) # Snapshot mirrors the file; no re-parse needed
+            if new_value == _MASK and current_actual_value:
                 results[key] = {'success': True, 'message': 'Sensitive value unchanged.'}
                 continue # Skip update for this key
 
+        # The UI posts the whole form back, so most keys are unchanged;
+        # skip validation and the file write for those
+        if _ENV_SNAPSHOT.get(key) == new_value:
+            results[key] = {'success': True, 'message': 'No change.'}
+            continue
+
         # Type Validation
         if not _validate_value(key, new_value, details):
-            results[key] = {'success': False, 'message': f"Invalid value format for type '{details['type']}'."}
+            results[key] = {'success': False, 'message': f"Invalid value format for type '{details.type}'."}
             continue
         
         # Normalize boolean values before saving
-        if details['type'] == 'bool':
-            if new_value.lower() in ['true', 'yes', '1', 'on']:
-                new_value = 'true'
-            elif new_value.lower() in ['false', 'no', '0', 'off', '']: # Treat empty string as false for bool
-                new_value = 'false'
+        if details.type == 'bool':
+            new_value = _BOOL_NORMALIZE.get(new_value.lower(), new_value)
         
         # If new_value for a sensitive field is now blank, it means "clear this sensitive value".
-        # `set_key` handles empty string correctly (sets `KEY=` or removes if it was `KEY=value`).
+        # An empty string is written as `KEY=""`.
 
-        try:
-            success = set_key(DOTENV_PATH, key, new_value, quote_mode='always')
-            if success:
-                results[key] = {'success': True, 'message': 'Updated successfully.'}
-                something_changed_successfully = True
-            else:
-                # This part of set_key from python-dotenv usually returns True if file write was okay,
-                # but good to have a branch.
-                results[key] = {'success': False, 'message': 'Failed to update due to an unexpected issue with set_key.'}
-        except Exception as e:
-            results[key] = {'success': False, 'message': f"Error writing to .env file: {e}"}
-            
-    if something_changed_successfully:
-        # Reload environment variables in the current process if any key was successfully updated.
-        # This makes changes available to os.getenv() immediately for the current process.
-        load_dotenv(DOTENV_PATH, override=True)
-        # Note: Some application components might need to be re-initialized or the app restarted
-        # to pick up certain changes (e.g., database connections, external service clients).
-        
-    return results
+        pending_writes[key] = new_value
 
-def ensure_init_py_exists():
-    """
-    Ensures that __init__.py exists in the managers directory, making it a package.
-    This is a utility function and might be better placed in a setup script.
-    On read-only filesystems, this will log an error if it needs to create the file.
-    """
-    managers_dir = os.path.dirname(os.path.abspath(__file__))
-    init_py_path = os.path.join(managers_dir, "__init__.py")
-    if not os.path.exists(init_py_path):
-        try:
-            # In a read-only environment, this write will fail.
-            # This function should ideally not be called at import time in such environments
-            # or should be designed to be a no-op if writing is not possible.
-            with open(init_py_path, 'w') as f:
-                f.write("# Initializes the managers package\n")
-            print(f"Created {init_py_path}")
-        except IOError as e:
-            print(f"Could not create {init_py_path} (expected in read-only environments): {e}")
-
-# Call it once to ensure the __init__.py exists for the 'managers' package
-if __name__ != "__main__": # Avoid running on direct script execution if any
-    # Consider removing this call if it causes issues in Vercel due to attempting file write,
-    # or ensure your deployment package includes this __init__.py.
-    # For Vercel, it's best if all necessary files, including __init__.py, are part of the deployment.
-    # ensure_init_py_exists() # Commenting out for Vercel to prevent write attempts
-    pass # __init__.py should be part of the codebase
-
-# Example usage (for testing this module directly):
-if __name__ == "__main__":
-    print("Configurable Settings Test:")
-    settings = get_all_configurable_settings_with_values()
-    for k, v in settings.items():
-        print(f"- {k}: Current Value='{v['current_value']}' (Type: {v['type']}, Sensitive: {v['sensitive']}, Options: {v.get('options', 'N/A')}) Desc: {v['description']}")
-
-    print("\nTesting update (example - MIN_VEHICLE_YEAR to 2020):")
-    # Ensure MIN_VEHICLE_YEAR is in CONFIGURABLE_SETTINGS for this test to run
-    if 'MIN_VEHICLE_YEAR' in CONFIGURABLE_SETTINGS:
-        update_results = update_multiple_config_values({'MIN_VEHICLE_YEAR': '2020', 'LOG_LEVEL': 'DEBUG', 'MADE_UP_KEY': 'test'})
-        print("Update Results:", update_results)
-        
-        print("\nFetching MIN_VEHICLE_YEAR and LOG_LEVEL again:")
-        print(f"MIN_VEHICLE_YEAR: {get_config_value('MIN_VEHICLE_YEAR')}")
-        print(f"LOG_LEVEL: {get_config_value('LOG_LEVEL')}")
-    else:
-        print("MIN_VEHICLE_YEAR not in CONFIGURABLE_SETTINGS, skipping update test.")
-
-    # Test creating/updating a sensitive key
-    if 'TEST_SENSITIVE_KEY' not in CONFIGURABLE_SETTINGS:
-        CONFIGURABLE_SETTINGS['TEST_SENSITIVE_KEY'] = {
-            'description': "A test sensitive key.",
-            'type': 'string',
-            'sensitive': True
-        }
-        print("Added TEST_SENSITIVE_KEY to CONFIGURABLE_SETTINGS for this test run.")
-
-    print("\nTesting update for TEST_SENSITIVE_KEY:")
-    update_results_sensitive = update_multiple_config_values({'TEST_SENSITIVE_KEY': 'mysecretvalue'})
-    print("Sensitive Update Results:", update_results_sensitive)
-    print(f"TEST_SENSITIVE_KEY (from get_config_value): {get_config_value('TEST_SENSITIVE_KEY')}")
-    
-    settings_after_sensitive_update = get_all_configurable_settings_with_values()
-    print(f"TEST_SENSITIVE_KEY (displayed): {settings_after_sensitive_update.get('TEST_SENSITIVE_KEY', {}).get('current_value')}")
+    if pending_writes:
+        # Single read-modify-write cycle for the whole batch instead of one
+        # full .env rewrite per key; _write_env keeps the rewrite atomic and
+        # the lock keeps concurrent UI threads from interleaving rewrites.
+        with _ENV_LOCK:
+            try:
+                env_values = _parse_env(DOTENV_PATH)
+                env_values.update(pending_writes)
+                _write_env(DOTENV_PATH, env_values)
 
-    print("\nTesting 'no change' for TEST_SENSITIVE_KEY by passing '********':")
-    update_results_nochange = update_multiple_config_values({'TEST_SENSITIVE_KEY': '********'})
-    print("No Change Sensitive Update Results:", update_results_nochange)
-    print(f"TEST_SENSITIVE_KEY (should be 'mysecretvalue'): {get_config_value('TEST_SENSITIVE_KEY')}")
+                _ENV_SNAPSHOT.update(pending_writes)  # Keep the read-path snapshot in sync
+                # Mirror into the process environment so os.getenv() sees the
+                # changes immediately, without re-parsing the file we just wrote.
+                os.environ.update(pending_writes)
+                # Drop the built settings cache without flagging an external
+                # edit: the snapshot is already current, so the next render
+                # rebuilds from memory instead of re-parsing the file
+                _SETTINGS_CACHE = None
+                _rebuild_typed_cache()
+                for key in pending_writes:
+                    results[key] = {'success': True, 'message': 'Updated successfully.'}
+                # Note: Some application components might need to be re-initialized or the app restarted
+                # to pick up certain changes (e.g., database connections, external service clients).
+            except Exception as e:
+                for key in pending_writes:
+                    results[key] = {'success': False, 'message': f"Error writing to .env file: {e}"}
 
+    return results
 
-    print("\nTesting clearing TEST_SENSITIVE_KEY by passing empty string:")
-    update_results_clear = update_multiple_config_values({'TEST_SENSITIVE_KEY': ''})
-    print("Clear Sensitive Update Results:", update_results_clear)
-    print(f"TEST_SENSITIVE_KEY (should be None or empty): {get_config_value('TEST_SENSITIVE_KEY')}")
-    
-    # Clean up the test key from .env if it was added
-    # Note: python-dotenv's set_key with an empty value might result in `KEY=` or removing the line.
-    # unset_key would be more explicit for removal if that's the desired behavior.
-    # For now, setting to empty string is fine.
-    # from dotenv import unset_key
-    # unset_key(DOTENV_PATH, 'TEST_SENSITIVE_KEY')
-    # print("Cleaned up TEST_SENSITIVE_KEY from .env")
-    set_key(DOTENV_PATH, 'TEST_SENSITIVE_KEY', '') # Effectively clears or sets to KEY=
-    load_dotenv(DOTENV_PATH, override=True)
-    print("Attempted to clear TEST_SENSITIVE_KEY in .env") 
\ No newline at end of file
+# Seed the typed cache from the snapshot loaded above
+_rebuild_typed_cache()
+
+# The manual exercise script lives in managers/_config_manager_cli.py so
+# that importing this module does not carry the test block's bytecode.
\ No newline at end of file
@@ -3,19 +3,35 @@ Data Manager module for handling data storage and retrieval operations.
 Primarily manages interactions with Google Sheets for storing car leads.
 """
 
+import logging
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+import contextlib
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import random
+import re
 import socket
+import tempfile
+import threading
 import time
 
-# from google.oauth2 import service_account # No longer using service account directly here
-from google.oauth2.credentials import Credentials as UserCredentials # For type hinting
-# Removing complex httplib2 and AuthorizedHttp imports that may be causing issues
-from googleapiclient.discovery import build
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; locking becomes a no-op
+    fcntl = None
+
+# googleapiclient.discovery and the httplib2/AuthorizedHttp transport are
+# imported lazily in _get_sheet_service_with_oauth: discovery drags in the
+# whole client machinery, which would otherwise be paid on every import of
+# this module even when Sheets is never used. HttpError stays top-level
+# because the except clauses need it at call time.
 from googleapiclient.errors import HttpError
 
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials as UserCredentials
+
 from utils.logger import setup_logger
 # from utils.ui_config_manager import are_google_credentials_configured # Old
 from utils.ui_config_manager import load_google_oauth_credentials, are_google_oauth_credentials_present
@@ -25,8 +41,85 @@ from utils.ui_config_manager import load_google_oauth_credentials, are_google_oa
 # Set up logger
 logger = setup_logger('data_manager')
 
-# Define path for local backup file
-LOCAL_DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'local_leads.json')
+# Define paths for local backup files. New writes go to the append-only
+# JSONL file (one lead per line); the legacy JSON-array file is still read
+# so existing backups aren't lost.
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOCAL_DATA_FILE = os.path.join(_PROJECT_DIR, 'local_leads.json')
+LOCAL_DATA_JSONL_FILE = os.path.join(_PROJECT_DIR, 'local_leads.jsonl')
+
+# Sidecar write-ahead log for lead status updates: each update appends one
+# delta line here instead of rewriting the whole backup, and the log is
+# folded back into the snapshot on compaction
+LOCAL_WAL_FILE = os.path.join(_PROJECT_DIR, 'local_leads.wal.jsonl')
+
+# Shared lock file guarding all local backup writes. The agent and the web
+# interface each run their own DataManager in separate processes against
+# the same backup files, so every write path (append, WAL delta, compaction)
+# must serialize on the same lock rather than on whichever file it happens
+# to be writing.
+LOCAL_LOCK_FILE = os.path.join(_PROJECT_DIR, 'local_leads.lock')
+
+# Compact the WAL into the snapshot after this many status updates
+_WAL_COMPACT_EVERY = 100
+
+
+@contextlib.contextmanager
+def _local_backup_lock():
+    """
+    Hold an exclusive cross-process lock over the local backup files.
+
+    A no-op where fcntl is unavailable (Windows); flock is not re-entrant,
+    so callers must not nest this.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(LOCAL_LOCK_FILE, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _local_backup_stamp():
+    """
+    Return a change stamp for the local backup files: (mtime_ns, size) per
+    file, or None where a file is absent. A stamp mismatch means another
+    process has written the backup since we last read it, so the in-memory
+    view must be reloaded before it is trusted.
+    """
+    stamp = []
+    for path in (LOCAL_DATA_FILE, LOCAL_DATA_JSONL_FILE, LOCAL_WAL_FILE):
+        try:
+            st = os.stat(path)
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+# Lead keys in sheet-column order (after the leading timestamp); mirrors
+# the header row written by _create_new_sheet
+LEAD_ROW_COLUMNS = (
+    'title', 'year', 'make', 'model', 'price', 'source', 'listing_url',
+    'description', 'phone_number', 'date_posted', 'Thryv_Status', 'Thryv_Lead_ID'
+)
+_LEAD_ROW_DEFAULTS = dict.fromkeys(LEAD_ROW_COLUMNS, '')
+
+# Strips dollar signs and thousands separators from scraped price strings;
+# compiled once rather than per lead. Deliberately narrow: stripping every
+# non-digit would concatenate multi-number strings like "20000 or 18000 obo"
+# into one bogus price, so anything else falls through to the parse warning.
+_PRICE_RE = re.compile(r'[$,]')
+
+# Normalized header keys produced by get_all_leads for a full sheet row,
+# in column order; used to extend the leads cache after an append
+_SHEET_HEADER_KEYS = (
+    'timestamp', 'title', 'year', 'make', 'model', 'price', 'source',
+    'listing_url', 'description', 'seller_phone', 'date_posted',
+    'thryv_status', 'thryv_lead_id'
+)
 
 # Set a default socket timeout for all HTTP requests
 # socket.setdefaulttimeout(60)  # This line should be commented out or removed.
@@ -41,7 +134,13 @@ class DataManager:
         config (dict): Configuration dictionary containing Google Sheets credentials
                       and other configuration parameters.
     """
-    
+
+    # How long a connectivity probe result stays valid before re-checking
+    NET_CHECK_TTL_SECONDS = 30.0
+
+    # How long a get_all_leads result is served from cache before re-fetching
+    LEADS_CACHE_TTL_SECONDS = 30.0
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the DataManager with the provided configuration.
@@ -55,7 +154,39 @@ class DataManager:
         
         # Define sheets and ranges
         self.leads_sheet_range = 'Leads!A:M'  # Extended to M for Thryv_Lead_ID
-        
+
+        # Cache of listing URLs already present in the sheet, so duplicate
+        # checks don't re-fetch the whole sheet on every append cycle.
+        # Published as a frozenset: readers (the web interface runs in other
+        # threads) always see an immutable snapshot, and writers swap in a
+        # new frozenset under the lock instead of mutating in place.
+        self._known_urls: frozenset = frozenset()
+        self._known_urls_loaded = False
+        self._known_urls_lock = threading.Lock()
+
+        # Connectivity probe result cache (see _check_internet_connection)
+        self._last_net_check_ts = 0.0
+        self._last_net_check_ok = False
+
+        # Shared authorized HTTP transport (see _get_sheet_service_with_oauth)
+        self._http = None
+
+        # Read-through cache for get_all_leads (see LEADS_CACHE_TTL_SECONDS)
+        self._leads_cache: Optional[List[Dict[str, Any]]] = None
+        self._leads_cache_ts = 0.0
+
+        # header name -> column letter map (see _get_header_column_map)
+        self._header_col_cache: Optional[Dict[str, str]] = None
+
+        # In-memory view of the local backup: full lead list plus an index
+        # keyed by _local_id, loaded lazily by _load_local_index
+        self._local_leads: Optional[List[Dict[str, Any]]] = None
+        self._leads_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._wal_writes = 0
+        # Backup-file change stamp taken when the in-memory view was loaded;
+        # a mismatch means another process wrote the files since then
+        self._local_stamp = None
+
         # Check internet connectivity first
         if not self._check_internet_connection():
             logger.error("No internet connection detected. Google Sheets functionality will not be available.")
@@ -64,7 +195,7 @@ class DataManager:
             return
         
         # Load user OAuth credentials
-        self.user_credentials: Optional[UserCredentials] = load_google_oauth_credentials()
+        self.user_credentials: Optional['UserCredentials'] = load_google_oauth_credentials()
         
         # Initialize sheets service if credentials loaded successfully
         if self.user_credentials and self.user_credentials.valid:
@@ -90,10 +221,25 @@ class DataManager:
             # Scenario 2: Sheet ID is configured, check if it's accessible
             elif self.sheet_id and self.sheet_id != self.placeholder_sheet_id:
                 try:
-                    # Access the spreadsheet with retries
-                    request = self.sheet_service.spreadsheets().get(spreadsheetId=self.sheet_id)
+                    # Verify access with a values.batchGet instead of the
+                    # heavier spreadsheets.get metadata call; grabbing the
+                    # header row plus the URL column here also pre-warms the
+                    # duplicate-check cache, saving the first fetch later
+                    sheet_name = self.leads_sheet_range.split('!')[0]
+                    request = self.sheet_service.spreadsheets().values().batchGet(
+                        spreadsheetId=self.sheet_id,
+                        ranges=[f"{sheet_name}!1:1", f"{sheet_name}!H2:H"],
+                        fields='valueRanges/values'
+                    )
                     try:
-                        self._execute_with_retry(request)
+                        result = self._execute_with_retry(request)
+                        value_ranges = result.get('valueRanges', []) if result else []
+                        if len(value_ranges) > 1:
+                            self._known_urls = frozenset(
+                                row[0] for row in value_ranges[1].get('values', [])
+                                if row and row[0]
+                            )
+                            self._known_urls_loaded = True
                         logger.info(f"Successfully accessed configured Google Sheet ID: {self.sheet_id}")
                     except HttpError as e:
                         if e.resp.status == 404:
@@ -140,6 +286,14 @@ class DataManager:
         Returns:
             bool: True if connection successful, False otherwise
         """
+        # A failed probe blocks for up to ~19s (3 x 5s timeouts plus the
+        # sleeps between attempts), so reuse a recent result instead of
+        # re-probing on every call within the TTL window
+        now = time.monotonic()
+        if now - self._last_net_check_ts < self.NET_CHECK_TTL_SECONDS:
+            logger.debug(f"Reusing cached internet connectivity result: {self._last_net_check_ok}")
+            return self._last_net_check_ok
+
         for attempt in range(max_retries):
             s = None  # Initialize s to None
             try:
@@ -148,6 +302,8 @@ class DataManager:
                 s.settimeout(timeout) # Set timeout only for this socket instance
                 s.connect((host, port))
                 logger.info("Internet connection test successful")
+                self._last_net_check_ts = time.monotonic()
+                self._last_net_check_ok = True
                 return True
             except socket.error as ex:
                 logger.warning(f"Internet connection test attempt {attempt+1}/{max_retries} failed: {ex}")
@@ -161,14 +317,16 @@ class DataManager:
                 # Depending on the error, you might not want to immediately return False or retry.
                 # For simplicity here, we'll let it fall through to the retry or final False.
                 if attempt == max_retries - 1: # If it's the last attempt on an unexpected error
-                    return False
+                    break
             finally:
                 if s:
                     s.close() # Ensure the socket is closed
-        
+
+        self._last_net_check_ts = time.monotonic()
+        self._last_net_check_ok = False
         return False
 
-    def _get_sheet_service_with_oauth(self, credentials: UserCredentials):
+    def _get_sheet_service_with_oauth(self, credentials: 'UserCredentials'):
         """
         Initialize and return the Google Sheets service object using OAuth credentials.
         
@@ -182,9 +340,24 @@ class DataManager:
             logger.error("Cannot initialize Google Sheets service: OAuth credentials invalid or missing.")
             return None
         try:
-            # Don't create custom HTTP object, as it's mutually exclusive with credentials
-            # Just build service with credentials
-            service = build('sheets', 'v4', credentials=credentials)
+            from googleapiclient.discovery import build
+
+            # Build the service on a shared AuthorizedHttp transport so every
+            # API call reuses the same keep-alive connection (httplib2 pools
+            # per Http instance) and gets an explicit timeout instead of
+            # blocking indefinitely. The transport is only rebuilt when the
+            # credentials object changes (e.g. after a token reload).
+            try:
+                from google_auth_httplib2 import AuthorizedHttp
+                from httplib2 import Http
+
+                if self._http is None or getattr(self._http, 'credentials', None) is not credentials:
+                    self._http = AuthorizedHttp(credentials, http=Http(timeout=30))
+                service = build('sheets', 'v4', http=self._http)
+            except ImportError:
+                # Fall back to letting the client library manage its own
+                # transport if google-auth-httplib2 is unavailable
+                service = build('sheets', 'v4', credentials=credentials)
             logger.info("Google Sheets service initialized successfully using OAuth credentials.")
             return service
         except Exception as e:
@@ -277,6 +450,31 @@ class DataManager:
             self.sheet_service = None
             return False
 
+    def _ensure_fresh_token(self) -> None:
+        """
+        Proactively refresh the OAuth token when it is about to expire.
+
+        Refreshing ahead of time saves the wasted round trip of a request
+        that comes back 401 followed by the reactive refresh-and-retry.
+        Credentials are persisted only when the token actually changed.
+        """
+        creds = self.user_credentials
+        if not creds or not creds.refresh_token:
+            return
+        expiry = getattr(creds, 'expiry', None)
+        if expiry is None or (expiry - datetime.utcnow()).total_seconds() >= 60:
+            return
+        try:
+            from google.auth.transport.requests import Request
+            old_token = creds.token
+            creds.refresh(Request())
+            if creds.token != old_token:
+                from utils.ui_config_manager import save_google_oauth_credentials
+                save_google_oauth_credentials(creds)
+            logger.info("Proactively refreshed Google OAuth token before expiry.")
+        except Exception as e:
+            logger.warning(f"Proactive token refresh failed: {e}. Will rely on reactive refresh on 401.")
+
     def append_leads_to_sheet(self, leads_data: List[Dict[str, Any]]) -> bool:
         """
         Append new leads to the Google Sheet.
@@ -293,15 +491,57 @@ class DataManager:
         
         # Clean and filter leads
         cleaned_leads = self._clean_leads_data(leads_data)
-        unique_leads = self.filter_duplicates(cleaned_leads)
+
+        # Drop duplicates within the batch itself before the sheet-level
+        # check; scrapers can return the same listing more than once per run
+        seen_urls = set()
+        deduped_leads = []
+        for lead in cleaned_leads:
+            url = lead.get('listing_url')
+            if url:
+                if url in seen_urls:
+                    logger.debug(f"Skipping in-batch duplicate lead: {lead.get('title')} - {url}")
+                    continue
+                seen_urls.add(url)
+            deduped_leads.append(lead)
+
+        unique_leads = self.filter_duplicates(deduped_leads)
         
         if not unique_leads:
             logger.info("No new unique leads to add.")
             return True
         
-        # Save to local backup first
-        self._save_to_local_backup(unique_leads)
-        
+        # Convert leads to row format up front so the backup thread and the
+        # row builder never touch the same lead dicts concurrently (the
+        # backup adds bookkeeping keys); one timestamp covers the whole
+        # batch instead of a strftime call per lead
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        value_range_body = {
+            'values': [self._lead_to_row(lead, timestamp) for lead in unique_leads]
+        }
+
+        # Overlap the local backup's disk I/O with the Sheets round trip;
+        # both are joined before returning
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            backup_future = executor.submit(self._save_to_local_backup, unique_leads)
+            pushed = self._push_leads_to_sheet(unique_leads, value_range_body)
+            backup_future.result()
+        return pushed
+
+    def _push_leads_to_sheet(self, unique_leads: List[Dict[str, Any]],
+                             value_range_body: Dict[str, Any]) -> bool:
+        """
+        Write pre-built lead rows to the Google Sheet.
+
+        Args:
+            unique_leads (list): The leads the rows were built from (used to
+                                 keep the duplicate-check cache in sync).
+            value_range_body (dict): Request body with the rows to append.
+
+        Returns:
+            bool: True if the rows were written (or saved locally when the
+                  sheet is unavailable), False otherwise.
+        """
         # If Google Sheets service is not available, return True since we saved locally
         if not self.sheet_service:
             if are_google_oauth_credentials_present():
@@ -318,24 +558,30 @@ class DataManager:
              logger.error("Google Sheets service still unavailable after refresh attempt. Leads saved locally only.")
              return True
         
-        # Convert leads to row format
-        value_range_body = {
-            'values': [self._lead_to_row(lead) for lead in unique_leads]
-        }
-        
+        self._ensure_fresh_token()
+
         try:
+            # RAW skips the server-side parsing pass of USER_ENTERED and
+            # stores values verbatim, which also means scraped text can
+            # never be interpreted as a formula
             request = self.sheet_service.spreadsheets().values().append(
                 spreadsheetId=self.sheet_id,
                 range=self.leads_sheet_range,
-                valueInputOption='USER_ENTERED',
+                valueInputOption='RAW',
                 insertDataOption='INSERT_ROWS',
                 body=value_range_body
             )
-            response = request.execute()
+            response = self._execute_with_retry(request)
+            # Keep the duplicate-check and leads caches in sync without
+            # another fetch
+            self._add_known_urls(unique_leads)
+            self._extend_leads_cache(value_range_body['values'])
             logger.info(f"Successfully added {len(unique_leads)} leads to Google Sheet.")
             return True
         except HttpError as error:
             logger.error(f"Error appending to Google Sheet: {error}")
+            # Cache may be out of step with the sheet; force a reload next time
+            self._known_urls_loaded = False
             # If a 401 or 403 error, token might be stale, try to refresh
             if error.resp.status in [401, 403]:
                 logger.info(f"Google API returned {error.resp.status}. Attempting token refresh.")
@@ -346,11 +592,14 @@ class DataManager:
                         request = self.sheet_service.spreadsheets().values().append(
                             spreadsheetId=self.sheet_id,
                             range=self.leads_sheet_range,
-                            valueInputOption='USER_ENTERED',
+                            valueInputOption='RAW',
                             insertDataOption='INSERT_ROWS',
                             body=value_range_body
                         )
-                        response = request.execute()
+                        response = self._execute_with_retry(request)
+                        self._add_known_urls(unique_leads)
+                        self._extend_leads_cache(value_range_body['values'])
+                        self._known_urls_loaded = True
                         logger.info(f"Successfully added {len(unique_leads)} leads to Google Sheet after refresh.")
                         return True
                     except HttpError as retry_error:
@@ -367,35 +616,21 @@ class DataManager:
             logger.error(f"Unexpected error appending to Google Sheet: {error}")
             return False
     
-    def _lead_to_row(self, lead: Dict[str, Any]) -> List[Any]:
+    def _lead_to_row(self, lead: Dict[str, Any], timestamp: str) -> List[Any]:
         """
         Convert a lead dictionary to a row format for Google Sheets.
-        
+
         Args:
             lead (dict): Lead dictionary.
-        
+            timestamp (str): Scrape timestamp shared by the whole batch.
+
         Returns:
             list: Lead data as a list for a sheet row.
         """
-        # Define a fixed order of columns for the sheet
-        # Adjust these fields to match your schema in the sheet
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        return [
-            timestamp,  # Timestamp
-            lead.get('title', ''),  # Title
-            lead.get('year', ''),  # Year
-            lead.get('make', ''),  # Make
-            lead.get('model', ''),  # Model
-            lead.get('price', ''),  # Price
-            lead.get('source', ''),  # Source (e.g., "Craigslist", "Facebook")
-            lead.get('listing_url', ''),  # Listing URL
-            lead.get('description', ''),  # Description
-            lead.get('phone_number', ''),  # Seller Phone (may be empty for many)
-            lead.get('date_posted', ''),  # Date Posted
-            lead.get('Thryv_Status', ''),  # Thryv_Status
-            lead.get('Thryv_Lead_ID', '')  # Thryv_Lead_ID
-        ]
+        # One dict merge against the module-level defaults replaces a
+        # .get() call per column; LEAD_ROW_COLUMNS fixes the column order
+        merged = {**_LEAD_ROW_DEFAULTS, **lead}
+        return [timestamp] + [merged[key] for key in LEAD_ROW_COLUMNS]
     
     def _clean_leads_data(self, leads_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -408,39 +643,45 @@ class DataManager:
             list: Cleaned lead dictionaries.
         """
         cleaned_leads = []
-        
+
+        # Hoisted out of the loop: the year threshold is constant per batch,
+        # and the debug-enabled check avoids formatting skipped-lead messages
+        # that would be thrown away at the default log level
+        min_year = int(self.config.get('MIN_VEHICLE_YEAR', 2018))
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         for lead in leads_data:
-            cleaned_lead = lead.copy()
-            
-            # Handle price (remove $ and commas, convert to number)
+            # Clean in place: the per-lead dict copy doubled allocations for
+            # no benefit — this pipeline owns the batch, and the backup save
+            # already annotates these same dicts further down
+            cleaned_lead = lead
+
+            # Handle price (strip $ / commas, convert to number)
             if 'price' in cleaned_lead and cleaned_lead['price']:
                 try:
-                    price_str = str(cleaned_lead['price'])
-                    # Remove $ and commas
-                    price_str = price_str.replace('$', '').replace(',', '')
+                    price_str = _PRICE_RE.sub('', str(cleaned_lead['price']))
                     cleaned_lead['price'] = int(float(price_str))
                 except (ValueError, TypeError):
                     logger.warning(f"Could not parse price: {cleaned_lead.get('price')}")
-            
+
             # Convert year to integer if possible
             if 'year' in cleaned_lead and cleaned_lead['year']:
                 try:
                     cleaned_lead['year'] = int(cleaned_lead['year'])
                 except (ValueError, TypeError):
                     logger.warning(f"Could not parse year: {cleaned_lead.get('year')}")
-            
+
             # Add to cleaned leads if it passes minimum year check
-            min_year = int(self.config.get('MIN_VEHICLE_YEAR', 2018))
             try:
                 if cleaned_lead.get('year', 0) >= min_year:
                     cleaned_leads.append(cleaned_lead)
-                else:
+                elif debug_enabled:
                     logger.debug(f"Skipping lead with year {cleaned_lead.get('year')} < {min_year}")
             except (ValueError, TypeError):
                 logger.warning(f"Year comparison failed for lead: {cleaned_lead.get('title')}")
                 # If we can't determine the year, include the lead for manual review
                 cleaned_leads.append(cleaned_lead)
-        
+
         return cleaned_leads
     
     def filter_duplicates(self, leads_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -469,61 +710,98 @@ class DataManager:
 
         if not leads_data:
             return []
-        
+
+        # Load the existing URLs once; subsequent calls reuse the cache and
+        # only hit the in-memory set
+        if not self._known_urls_loaded and not self._load_known_urls():
+            logger.error("Could not load existing URLs for duplicate check. Assuming all leads are new.")
+            return leads_data
+
+        unique_leads = []
+        for lead in leads_data:
+            listing_url = lead.get('listing_url', '')
+            if listing_url and listing_url not in self._known_urls:
+                unique_leads.append(lead)
+            elif listing_url in self._known_urls:
+                logger.debug(f"Skipping duplicate lead: {lead.get('title')} - {listing_url}")
+            else: # No URL, cannot reliably check for duplicates, include for manual review
+                logger.warning(f"Lead missing URL, cannot check for duplicate, including: {lead.get('title')}")
+                unique_leads.append(lead)
+
+        logger.info(f"Found {len(leads_data) - len(unique_leads)} duplicates out of {len(leads_data)} leads.")
+        return unique_leads
+
+    def _add_known_urls(self, leads: List[Dict[str, Any]]) -> None:
+        """
+        Add the listing URLs of freshly appended leads to the duplicate-check
+        cache by swapping in a new frozenset under the lock.
+        """
+        new_urls = [lead['listing_url'] for lead in leads if lead.get('listing_url')]
+        if not new_urls:
+            return
+        with self._known_urls_lock:
+            self._known_urls = self._known_urls.union(new_urls)
+
+    def _extend_leads_cache(self, rows: List[List[Any]]) -> None:
+        """
+        Extend a still-fresh get_all_leads cache with freshly appended rows,
+        keyed the same way get_all_leads keys sheet rows.
+        """
+        if self._leads_cache is None:
+            return
+        self._leads_cache.extend(dict(zip(_SHEET_HEADER_KEYS, row)) for row in rows)
+
+    def _load_known_urls(self) -> bool:
+        """
+        Fetch the listing URLs already in the sheet and cache them in
+        self._known_urls. Called lazily on the first duplicate check; the
+        cache is kept current by append_leads_to_sheet afterwards.
+
+        Returns:
+            bool: True if the cache was (re)loaded successfully, False otherwise.
+        """
+        self._ensure_fresh_token()
+
         try:
+            # Only the Listing URL column (H, skipping the header row) is
+            # needed for duplicate detection; fetching it alone moves a
+            # fraction of the data of the full A:M range, and fields='values'
+            # strips the range/majorDimension metadata from the response
             request = self.sheet_service.spreadsheets().values().get(
                 spreadsheetId=self.sheet_id,
-                range=self.leads_sheet_range
+                range=f"{self.leads_sheet_range.split('!')[0]}!H2:H",
+                fields='values'
             )
-            result = request.execute()
-            existing_values = result.get('values', [])
-            if not existing_values: return leads_data
-
-            url_column_index = 7 # Default: Listing URL in column H (index 7)
-            try: # Try to find 'listing_url' in headers
-                headers = [h.lower().replace(' ', '_') for h in existing_values[0]]
-                if 'listing_url' in headers:
-                    url_column_index = headers.index('listing_url')
-            except IndexError:
-                logger.warning("Could not read headers for duplicate check, using default URL column index.")
-
-            existing_urls = set()
-            for row in existing_values[1:]:
-                if len(row) > url_column_index and row[url_column_index]:
-                    existing_urls.add(row[url_column_index])
-            
-            unique_leads = []
-            for lead in leads_data:
-                listing_url = lead.get('listing_url', '')
-                if listing_url and listing_url not in existing_urls:
-                    unique_leads.append(lead)
-                elif listing_url in existing_urls:
-                    logger.debug(f"Skipping duplicate lead: {lead.get('title')} - {listing_url}")
-                else: # No URL, cannot reliably check for duplicates, include for manual review
-                    logger.warning(f"Lead missing URL, cannot check for duplicate, including: {lead.get('title')}")
-                    unique_leads.append(lead)
-            
-            logger.info(f"Found {len(leads_data) - len(unique_leads)} duplicates out of {len(leads_data)} leads.")
-            return unique_leads
-        
+            result = self._execute_with_retry(request)
+            existing_values = result.get('values', []) if result else []
+
+            known_urls = set()
+            for row in existing_values:
+                if row and row[0]:
+                    known_urls.add(row[0])
+
+            self._known_urls = frozenset(known_urls)
+            self._known_urls_loaded = True
+            logger.info(f"Cached {len(known_urls)} existing listing URLs for duplicate checks.")
+            return True
+
         except HttpError as error:
-            logger.error(f"Error checking for duplicates: {error}")
+            logger.error(f"Error loading existing URLs for duplicate check: {error}")
+            self._known_urls_loaded = False
             if error.resp.status in [401, 403]:
-                logger.info(f"Google API returned {error.resp.status} for filter_duplicates. Attempting token refresh.")
+                logger.info(f"Google API returned {error.resp.status} while loading URLs. Attempting token refresh.")
                 if self.refresh_google_connection():
-                    logger.info("Token refreshed. Retrying filter_duplicates.")
-                    return self.filter_duplicates(leads_data) # Retry
-                else:
-                    logger.error("Token refresh failed for filter_duplicates. Assuming all leads are new.")
-                    return leads_data
-            return leads_data # For other HttpErrors, assume all new
+                    logger.info("Token refreshed. Retrying URL cache load.")
+                    return self._load_known_urls() # Retry
+                logger.error("Token refresh failed while loading URL cache.")
+            return False
         except TimeoutError as error:
-            logger.error(f"Timeout checking for duplicates: {error}. Check your network connection.")
-            return leads_data  # Assume all new on timeout
+            logger.error(f"Timeout loading existing URLs for duplicate check: {error}. Check your network connection.")
+            return False
         except Exception as error:
-            logger.error(f"Unexpected error checking for duplicates: {error}")
-            return leads_data  # Assume all new on error
-    
+            logger.error(f"Unexpected error loading existing URLs for duplicate check: {error}")
+            return False
+
     def _save_to_local_backup(self, leads_data: List[Dict[str, Any]]):
         """
         Save leads to a local JSON file as backup or for offline usage.
@@ -532,30 +810,38 @@ class DataManager:
             leads_data (list): List of lead dictionaries to save.
         """
         try:
-            # Read existing leads if file exists
-            existing_leads = []
-            if os.path.exists(LOCAL_DATA_FILE):
-                with open(LOCAL_DATA_FILE, 'r') as f:
-                    try:
-                        existing_leads = json.load(f)
-                    except json.JSONDecodeError:
-                        logger.error(f"Error reading local data file. Starting fresh.")
-                        existing_leads = []
-            
-            # Add new leads
-            for lead in leads_data:
-                # Add a local ID and timestamp if not present
-                if '_local_id' not in lead:
-                    lead['_local_id'] = str(datetime.now().timestamp())
-                if 'Date Scraped' not in lead:
-                    lead['Date Scraped'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
-                existing_leads.append(lead)
-            
-            # Write back to file
-            with open(LOCAL_DATA_FILE, 'w') as f:
-                json.dump(existing_leads, f, indent=2)
-            
+            # Append one compact JSON line per lead instead of re-reading and
+            # rewriting the whole backup on every save; cost stays O(new
+            # leads) no matter how large the backup grows. The shared lock
+            # keeps the agent and the web interface from interleaving writes
+            # or compacting the file out from under this append.
+            with _local_backup_lock():
+                # If another process wrote the backup since our view was
+                # loaded, drop the view rather than extend a stale list; the
+                # next read reloads everything from disk
+                if (self._local_leads is not None
+                        and self._local_stamp != _local_backup_stamp()):
+                    self._local_leads = None
+                    self._leads_index = None
+
+                with open(LOCAL_DATA_JSONL_FILE, 'a') as f:
+                    for lead in leads_data:
+                        # Add a local ID and timestamp if not present
+                        if '_local_id' not in lead:
+                            lead['_local_id'] = str(datetime.now().timestamp())
+                        if 'Date Scraped' not in lead:
+                            lead['Date Scraped'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        f.write(json.dumps(lead, separators=(',', ':')) + '\n')
+                    f.flush()
+
+                # Keep the in-memory view, if still current, in step with the file
+                if self._local_leads is not None:
+                    self._local_leads.extend(leads_data)
+                    for lead in leads_data:
+                        if lead.get('_local_id'):
+                            self._leads_index[lead['_local_id']] = lead
+                    self._local_stamp = _local_backup_stamp()
+
             logger.info(f"Saved {len(leads_data)} leads to local backup file.")
         except Exception as e:
             logger.error(f"Error saving to local backup: {e}")
@@ -567,6 +853,13 @@ class DataManager:
         Returns:
             list: List of lead dictionaries.
         """
+        # Serve repeat reads (e.g. web interface refreshes) from cache for a
+        # short window instead of re-fetching the whole sheet each time
+        if (self._leads_cache is not None
+                and time.monotonic() - self._leads_cache_ts < self.LEADS_CACHE_TTL_SECONDS):
+            logger.debug(f"Serving {len(self._leads_cache)} leads from cache.")
+            return self._leads_cache
+
         if not self.sheet_service:
             if are_google_oauth_credentials_present():
                 logger.warning("Sheets service not initialized for get_all_leads, but OAuth credentials seem present. Attempting to refresh connection.")
@@ -581,7 +874,9 @@ class DataManager:
         if not self.sheet_service:
             logger.error("Google Sheets service still unavailable for get_all_leads. Falling back to local backup.")
             return self._get_leads_from_local_backup()
-            
+
+        self._ensure_fresh_token()
+
         try:
             request = self.sheet_service.spreadsheets().values().get(
                 spreadsheetId=self.sheet_id,
@@ -601,13 +896,10 @@ class DataManager:
                 logger.info("No leads found in Google Sheet.")
                 return self._get_leads_from_local_backup()
             
-            headers = [h.lower().replace(' ', '_') for h in values[0]]
-            leads = []
-            for row in values[1:]:
-                padded_row = row + [''] * (len(headers) - len(row))
-                lead = dict(zip(headers, padded_row))
-                leads.append(lead)
-            
+            leads = self._rows_to_leads(values)
+
+            self._leads_cache = leads
+            self._leads_cache_ts = time.monotonic()
             logger.info(f"Retrieved {len(leads)} leads from Google Sheet.")
             return leads
         
@@ -631,8 +923,9 @@ class DataManager:
                             
                         values = result.get('values', [])
                         if not values: return self._get_leads_from_local_backup()
-                        headers = [h.lower().replace(' ', '_') for h in values[0]]
-                        leads = [dict(zip(headers, r + [''] * (len(headers) - len(r)))) for r in values[1:]]
+                        leads = self._rows_to_leads(values)
+                        self._leads_cache = leads
+                        self._leads_cache_ts = time.monotonic()
                         logger.info(f"Retrieved {len(leads)} leads from Google Sheet after refresh.")
                         return leads
                     except Exception as retry_error:
@@ -649,25 +942,131 @@ class DataManager:
             logger.error(f"Unexpected error retrieving leads from Google Sheet: {error}. Falling back to local backup.")
             return self._get_leads_from_local_backup()
     
+    @staticmethod
+    def _rows_to_leads(values: List[List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Convert raw sheet values (header row + data rows) into lead dicts.
+
+        The header tuple, row width and padding list are computed once for
+        the whole payload; full-width rows (the common case) skip the
+        padding allocation entirely.
+
+        Args:
+            values (list): Sheet values, first row being the header.
+
+        Returns:
+            list: One dict per data row, keyed by normalized header names.
+        """
+        header_tuple = tuple(h.lower().replace(' ', '_') for h in values[0])
+        n = len(header_tuple)
+        empty_tail = [''] * n
+        return [
+            dict(zip(header_tuple, row if len(row) == n else row + empty_tail[len(row):]))
+            for row in values[1:]
+        ]
+
+    def _iter_local_backup_leads(self):
+        """
+        Yield leads from the local backup files one at a time.
+
+        Reads the legacy JSON-array file first (if present), then streams
+        the append-only JSONL file line by line so large backups are never
+        held in memory twice.
+
+        Yields:
+            dict: Lead dictionaries from local backup.
+        """
+        if os.path.exists(LOCAL_DATA_FILE):
+            try:
+                with open(LOCAL_DATA_FILE, 'r') as f:
+                    legacy_leads = json.load(f)
+                for lead in legacy_leads:
+                    yield lead
+            except Exception as e:
+                logger.error(f"Error reading legacy local backup: {e}")
+
+        if os.path.exists(LOCAL_DATA_JSONL_FILE):
+            try:
+                with open(LOCAL_DATA_JSONL_FILE, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            yield json.loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning("Skipping corrupt line in local backup file.")
+            except Exception as e:
+                logger.error(f"Error reading from local backup: {e}")
+
+    def _read_local_state(self):
+        """
+        Read the full local backup state from disk: the lead list, an index
+        keyed by _local_id, and the count of WAL deltas replayed on top.
+
+        Callers are responsible for holding the backup lock; this only reads.
+
+        Returns:
+            tuple: (leads, index, wal_replayed)
+        """
+        leads = list(self._iter_local_backup_leads())
+        index = {lead['_local_id']: lead for lead in leads if lead.get('_local_id')}
+        wal_replayed = 0
+
+        if os.path.exists(LOCAL_WAL_FILE):
+            try:
+                with open(LOCAL_WAL_FILE, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            delta = json.loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning("Skipping corrupt line in local WAL file.")
+                            continue
+                        lead = index.get(delta.get('id'))
+                        if lead is not None:
+                            lead['Status'] = delta.get('status', lead.get('Status'))
+                            if delta.get('notes'):
+                                lead['Notes'] = delta['notes']
+                            lead['Last_Updated'] = delta.get('ts', lead.get('Last_Updated'))
+                        wal_replayed += 1
+            except Exception as e:
+                logger.error(f"Error replaying local WAL file: {e}")
+
+        return leads, index, wal_replayed
+
+    def _load_local_index(self) -> None:
+        """
+        Load the local backup into memory under the shared lock: the full
+        lead list plus an index keyed by _local_id, with any pending WAL
+        deltas replayed on top so updates survive a crash before compaction.
+        """
+        with _local_backup_lock():
+            leads, index, wal_replayed = self._read_local_state()
+            self._local_leads = leads
+            self._leads_index = index
+            self._wal_writes = wal_replayed
+            self._local_stamp = _local_backup_stamp()
+
     def _get_leads_from_local_backup(self) -> List[Dict[str, Any]]:
         """
-        Retrieve leads from local backup file when Google Sheets is not available.
-        
+        Retrieve leads from local backup files when Google Sheets is not available.
+
         Returns:
             list: List of lead dictionaries from local backup.
         """
-        try:
-            if os.path.exists(LOCAL_DATA_FILE):
-                with open(LOCAL_DATA_FILE, 'r') as f:
-                    leads = json.load(f)
-                logger.info(f"Retrieved {len(leads)} leads from local backup.")
-                return leads
-            else:
-                logger.warning("No local backup file found.")
-                return []
-        except Exception as e:
-            logger.error(f"Error reading from local backup: {e}")
-            return []
+        # Reload if never loaded, or if another process (agent vs web
+        # interface) has written the backup files since our last read
+        if self._local_leads is None or self._local_stamp != _local_backup_stamp():
+            self._load_local_index()
+        leads = self._local_leads
+        if leads:
+            logger.info(f"Retrieved {len(leads)} leads from local backup.")
+        else:
+            logger.warning("No leads found in local backup.")
+        return leads
     
     def update_lead_status(self, lead_id: str, status: str, notes: Optional[str] = None) -> bool:
         """
@@ -682,37 +1081,124 @@ class DataManager:
             bool: True if successful, False otherwise.
         """
         try:
-            if not os.path.exists(LOCAL_DATA_FILE):
-                logger.warning("No local backup file found to update lead status.")
-                return False
-            
-            with open(LOCAL_DATA_FILE, 'r') as f:
-                leads = json.load(f)
-            
-            # Find the lead by ID
-            lead_found = False
-            for lead in leads:
-                if lead.get('_local_id') == lead_id:
-                    lead['Status'] = status
-                    if notes:
-                        lead['Notes'] = notes
-                    lead['Last_Updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    lead_found = True
-                    break
-            
-            if lead_found:
-                # Write back to file
-                with open(LOCAL_DATA_FILE, 'w') as f:
-                    json.dump(leads, f, indent=2)
-                logger.info(f"Updated lead {lead_id} status to {status}")
-                return True
-            else:
-                logger.warning(f"Lead with ID {lead_id} not found.")
-                return False
+            # Lookup, mutate and WAL append all happen under one hold of the
+            # shared lock so another process can't write (or compact) the
+            # backup between our staleness check and our append
+            with _local_backup_lock():
+                if self._leads_index is None or self._local_stamp != _local_backup_stamp():
+                    leads, index, wal_replayed = self._read_local_state()
+                    self._local_leads = leads
+                    self._leads_index = index
+                    self._wal_writes = wal_replayed
+
+                lead = self._leads_index.get(lead_id)
+                if lead is None:
+                    logger.warning(f"Lead with ID {lead_id} not found.")
+                    return False
+
+                # Mutate the in-memory lead, then append a one-line delta to
+                # the WAL instead of rewriting the whole backup — O(1) I/O
+                # per update; the deltas are folded into the snapshot on
+                # compaction
+                ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                lead['Status'] = status
+                if notes:
+                    lead['Notes'] = notes
+                lead['Last_Updated'] = ts
+
+                delta = {'id': lead_id, 'status': status, 'notes': notes, 'ts': ts}
+                with open(LOCAL_WAL_FILE, 'a') as f:
+                    f.write(json.dumps(delta, separators=(',', ':')) + '\n')
+                    f.flush()
+                self._local_stamp = _local_backup_stamp()
+
+            self._wal_writes += 1
+            if self._wal_writes >= _WAL_COMPACT_EVERY:
+                self._compact_local_backup()
+
+            logger.info(f"Updated lead {lead_id} status to {status}")
+            return True
         except Exception as e:
             logger.error(f"Error updating lead status in local backup: {e}")
             return False
+
+    def _compact_local_backup(self) -> None:
+        """
+        Fold pending WAL deltas back into the JSONL snapshot and remove the
+        WAL, holding the shared lock for the whole rewrite.
+
+        The state is re-read from disk under the lock rather than taken from
+        this process's memory: the agent and the web interface both write
+        these files, so compacting from one process's in-memory view would
+        silently discard the other's appends and deltas. The snapshot is
+        written via a temp file and atomic rename so a crash mid-write can
+        never leave a truncated backup; any legacy JSON-array file is
+        consolidated into it at the same time.
+        """
+        with _local_backup_lock():
+            leads, index, _ = self._read_local_state()
+            tmp = tempfile.NamedTemporaryFile(
+                'w', dir=_PROJECT_DIR, prefix='.local_leads.', suffix='.tmp', delete=False
+            )
+            try:
+                with tmp as f:
+                    for lead in leads:
+                        f.write(json.dumps(lead, separators=(',', ':')) + '\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp.name, LOCAL_DATA_JSONL_FILE)
+            except Exception:
+                try:
+                    os.unlink(tmp.name)
+                except OSError:
+                    pass
+                raise
+            if os.path.exists(LOCAL_DATA_FILE):
+                os.remove(LOCAL_DATA_FILE)
+            if os.path.exists(LOCAL_WAL_FILE):
+                os.remove(LOCAL_WAL_FILE)
+            # Publish the merged state so our view reflects any writes the
+            # other process made before the lock was taken
+            self._local_leads = leads
+            self._leads_index = index
+            self._wal_writes = 0
+            self._local_stamp = _local_backup_stamp()
+        logger.info(f"Compacted local backup ({len(leads)} leads).")
     
+    def _get_header_column_map(self) -> Dict[str, str]:
+        """
+        Return a map of normalized header name -> column letter for the
+        Leads sheet, fetching the header row once and caching the result.
+
+        Headers only change on schema edits, so every status update paying a
+        1:1 range fetch just to locate the Thryv columns was wasted I/O. The
+        cache is invalidated by callers on auth/range errors.
+
+        Returns:
+            dict: header -> column letter, empty on fetch failure.
+        """
+        if self._header_col_cache is not None:
+            return self._header_col_cache
+
+        sheet_name = self.leads_sheet_range.split('!')[0]
+        try:
+            request = self.sheet_service.spreadsheets().values().get(
+                spreadsheetId=self.sheet_id,
+                range=f"{sheet_name}!1:1"
+            )
+            header_result = self._execute_with_retry(request)
+            headers = [
+                h.lower().replace(' ', '_')
+                for h in (header_result or {}).get('values', [[]])[0]
+            ]
+            self._header_col_cache = {
+                header: chr(ord('A') + idx) for idx, header in enumerate(headers)
+            }
+            return self._header_col_cache
+        except Exception as header_e:
+            logger.warning(f"Could not fetch sheet headers for column lookup: {header_e}")
+            return {}
+
     def update_thryv_status(self, row_index: int, thryv_status: str, thryv_lead_id: Optional[str] = None) -> bool:
         """
         Update the Thryv status and lead ID for a specific lead in the Google Sheet.
@@ -740,58 +1226,44 @@ class DataManager:
              return False
             
         try:
-            # Define the range for Thryv status column (assume column L for status, M for ID)
-            # This needs to be robust. Ideally, find column by header name.
-            # For now, let's assume column L (index 11) for Thryv_Status and M (index 12) for Thryv_Lead_ID
-            status_column_letter = 'L' # Placeholder
-            lead_id_column_letter = 'M' # Placeholder
+            # Resolve the Thryv columns from the cached header map, falling
+            # back to the historical defaults of L (status) and M (lead ID)
+            cols = self._get_header_column_map()
+            status_column_letter = cols.get('thryv_status', 'L')
+            lead_id_column_letter = cols.get('thryv_lead_id', 'M')
 
-            # A more robust way: get headers and find column index
-            try:
-                request = self.sheet_service.spreadsheets().values().get(
-                    spreadsheetId=self.sheet_id, 
-                    range=f"{self.leads_sheet_range.split('!')[0]}!1:1"
-                )
-                header_result = request.execute()
-                headers = [h.lower().replace(' ', '_') for h in header_result.get('values', [[]])[0]]
-                if 'thryv_status' in headers:
-                    status_column_letter = chr(ord('A') + headers.index('thryv_status'))
-                if 'thryv_lead_id' in headers:
-                    lead_id_column_letter = chr(ord('A') + headers.index('thryv_lead_id'))
-            except Exception as header_e:
-                logger.warning(f"Could not dynamically determine Thryv status columns, using defaults L & M: {header_e}")
-
-            status_range = f"{self.leads_sheet_range.split('!')[0]}!{status_column_letter}{row_index}"
-            lead_id_range_val = f"{self.leads_sheet_range.split('!')[0]}!{lead_id_column_letter}{row_index}"
-            
-            status_body = {
-                'values': [[thryv_status]]
+            sheet_name = self.leads_sheet_range.split('!')[0]
+            status_range = f"{sheet_name}!{status_column_letter}{row_index}"
+            lead_id_range_val = f"{sheet_name}!{lead_id_column_letter}{row_index}"
+
+            # Write both cells in one batchUpdate instead of two sequential
+            # update calls — half the round trips and half the quota cost —
+            # and go through _execute_with_retry so 429/5xx get backoff like
+            # the read paths
+            data = [{'range': status_range, 'values': [[thryv_status]]}]
+            if thryv_lead_id:
+                data.append({'range': lead_id_range_val, 'values': [[thryv_lead_id]]})
+            body = {
+                'valueInputOption': 'USER_ENTERED',
+                'data': data
             }
-            request = self.sheet_service.spreadsheets().values().update(
+            request = self.sheet_service.spreadsheets().values().batchUpdate(
                 spreadsheetId=self.sheet_id,
-                range=status_range,
-                valueInputOption='USER_ENTERED',
-                body=status_body
+                body=body
             )
-            request.execute()
-            
-            if thryv_lead_id:
-                lead_id_body = {
-                    'values': [[thryv_lead_id]]
-                }
-                request = self.sheet_service.spreadsheets().values().update(
-                    spreadsheetId=self.sheet_id,
-                    range=lead_id_range_val,
-                    valueInputOption='USER_ENTERED',
-                    body=lead_id_body
-                )
-                request.execute()
-                
+            self._execute_with_retry(request)
+
+
+            # Status changed in the sheet; drop the cached leads snapshot
+            self._leads_cache = None
             logger.info(f"Updated Thryv status to '{thryv_status}' for row {row_index}")
             return True
             
         except HttpError as error:
             logger.error(f"Error updating Thryv status in Google Sheet: {error}")
+            if error.resp.status in [400, 401, 403]:
+                # Range or auth error: the cached column map may be stale
+                self._header_col_cache = None
             if error.resp.status in [401, 403]:
                 logger.info(f"Google API returned {error.resp.status} for update_thryv_status. Attempting refresh.")
                 if self.refresh_google_connection():
@@ -808,6 +1280,93 @@ class DataManager:
             logger.error(f"Unexpected error updating Thryv status in Google Sheet: {error}")
             return False
 
+    def batch_update_thryv_statuses(self, status_updates: List[Dict[str, Any]]) -> bool:
+        """
+        Update Thryv status (and optionally lead ID) for many rows with a
+        single values.batchUpdate call instead of one write per lead.
+
+        Args:
+            status_updates (list): List of dicts with keys 'row_index',
+                                   'thryv_status' and optional 'thryv_lead_id'.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        if not status_updates:
+            return True
+
+        if not self.sheet_service:
+            if are_google_oauth_credentials_present():
+                logger.warning("Sheets service not initialized for batch_update_thryv_statuses. Attempting refresh.")
+                if not self.refresh_google_connection():
+                    logger.error("Failed to refresh Google connection. Cannot batch update Thryv statuses in sheet.")
+                    return False
+            else:
+                logger.warning("Sheets service not initialized and no OAuth. Cannot batch update Thryv statuses in sheet.")
+                return False
+
+        if not self.sheet_service:
+             logger.error("Google Sheets service still unavailable for batch_update_thryv_statuses.")
+             return False
+
+        try:
+            sheet_name = self.leads_sheet_range.split('!')[0]
+
+            # Resolve the Thryv columns from the cached header map, falling
+            # back to the historical defaults of L (status) and M (lead ID)
+            cols = self._get_header_column_map()
+            status_column_letter = cols.get('thryv_status', 'L')
+            lead_id_column_letter = cols.get('thryv_lead_id', 'M')
+
+            data = []
+            for update in status_updates:
+                row_index = update['row_index']
+                data.append({
+                    'range': f"{sheet_name}!{status_column_letter}{row_index}",
+                    'values': [[update['thryv_status']]]
+                })
+                if update.get('thryv_lead_id'):
+                    data.append({
+                        'range': f"{sheet_name}!{lead_id_column_letter}{row_index}",
+                        'values': [[update['thryv_lead_id']]]
+                    })
+
+            body = {
+                'valueInputOption': 'USER_ENTERED',
+                'data': data
+            }
+            request = self.sheet_service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.sheet_id,
+                body=body
+            )
+            self._execute_with_retry(request)
+
+            # Statuses changed in the sheet; drop the cached leads snapshot
+            self._leads_cache = None
+            logger.info(f"Batch updated Thryv status for {len(status_updates)} rows in one request.")
+            return True
+
+        except HttpError as error:
+            logger.error(f"Error batch updating Thryv statuses in Google Sheet: {error}")
+            if error.resp.status in [400, 401, 403]:
+                # Range or auth error: the cached column map may be stale
+                self._header_col_cache = None
+            if error.resp.status in [401, 403]:
+                logger.info(f"Google API returned {error.resp.status} for batch_update_thryv_statuses. Attempting refresh.")
+                if self.refresh_google_connection():
+                    logger.info("Token refreshed. Retrying batch_update_thryv_statuses.")
+                    return self.batch_update_thryv_statuses(status_updates) # Retry
+                else:
+                    logger.error("Token refresh failed for batch_update_thryv_statuses.")
+                    return False
+            return False
+        except TimeoutError as error:
+            logger.error(f"Timeout batch updating Thryv statuses in Google Sheet: {error}. Check your network connection.")
+            return False
+        except Exception as error:
+            logger.error(f"Unexpected error batch updating Thryv statuses in Google Sheet: {error}")
+            return False
+
     def get_created_sheet_info(self) -> Optional[str]:
         """Returns the info message if a new sheet was created, None otherwise."""
         return self.config.pop('GOOGLE_SHEET_ID_CREATED_INFO', None)
@@ -892,23 +1451,28 @@ class DataManager:
             logger.error(f"An unexpected error occurred while creating new Google Sheet: {e}")
             return None 
 
-    def _execute_with_retry(self, request, max_retries=3, retry_delay=2):
+    def _execute_with_retry(self, request, max_retries=5, base_delay=1.0, max_delay=30.0):
         """
         Execute a Google API request with retries for better resilience.
-        
+
+        Only rate-limit and server errors (429, 500, 502, 503, 504) are
+        retried; anything else is raised immediately so auth failures still
+        reach the callers' 401/403 refresh handling.
+
         Args:
             request: The Google API request object
-            max_retries (int): Maximum number of retry attempts
-            retry_delay (int): Delay between retries in seconds
-            
+            max_retries (int): Maximum number of attempts
+            base_delay (float): Initial backoff delay in seconds
+            max_delay (float): Cap on the backoff delay in seconds
+
         Returns:
             The API response or None if all attempts fail
-            
+
         Raises:
             Original exception after all retries are exhausted
         """
         last_exception = None
-        
+
         for attempt in range(max_retries):
             try:
                 return request.execute()
@@ -917,14 +1481,23 @@ class DataManager:
                 if isinstance(error, HttpError) and error.resp.status not in [429, 500, 502, 503, 504]:
                     # Don't retry if it's not a rate limit or server error
                     raise
-                
-                logger.warning(f"API request attempt {attempt+1}/{max_retries} failed: {error}. Retrying in {retry_delay}s...")
-                time.sleep(retry_delay)
-                # Increase delay for next retry (exponential backoff)
-                retry_delay *= 2
-                continue
-        
+                if attempt == max_retries - 1:
+                    break
+
+                # Exponential backoff with jitter so concurrent callers don't
+                # retry in lockstep; honor the server's Retry-After if sent
+                delay = min(max_delay, base_delay * (2 ** attempt)) * (1 + random.random() * 0.5)
+                if isinstance(error, HttpError):
+                    retry_after = error.resp.get('retry-after')
+                    if retry_after:
+                        try:
+                            delay = max(delay, float(retry_after))
+                        except (TypeError, ValueError):
+                            pass
+                logger.warning(f"API request attempt {attempt+1}/{max_retries} failed: {error}. Retrying in {delay:.1f}s...")
+                time.sleep(delay)
+
         # If we get here, all retries failed
         if last_exception:
             raise last_exception
-        return None 
\ No newline at end of file
+        return None
\ No newline at end of file
@@ -6,6 +6,17 @@ from twilio.base.exceptions import TwilioRestException
 # Set up logger
 logger = setup_logger('messaging_manager')
 
+# Common US phone number formats folded into one alternation, compiled
+# once at import; a single search() pass covers what used to take three
+# separate scans of the text. Full 10-digit forms come before the local
+# 555-1234 form so the longer match wins at the same position.
+_PHONE_RE = re.compile(
+    r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'  # 123-456-7890, 123.456.7890, 123 456 7890
+    r'|\(\d{3}\)[\s-]?\d{3}[-.\s]?\d{4}'  # (123) 456-7890, (123)456-7890
+    r'|\d{3}-\d{4}'  # Local number: 555-1234 (less reliable, might cause false positives)
+)
+_NON_DIGIT = re.compile(r'\D')
+
 class MessagingManager:
     def __init__(self, config):
         """
@@ -59,19 +70,13 @@ class MessagingManager:
         """
         if not text:
             return None
-        
-        # Common US phone number patterns
-        patterns = [
-            r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})',  # 123-456-7890, 123.456.7890, 123 456 7890
-            r'\((\d{3})\)[\s-]?\d{3}[-.\s]?\d{4}',  # (123) 456-7890, (123)456-7890
-            r'\d{3}-\d{4}',  # Local number: 555-1234 (less reliable, might cause false positives)
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return self._normalize_phone_number(matches[0])
-        
+
+        # One pass over the text with the combined pattern; the first
+        # number encountered wins
+        match = _PHONE_RE.search(text)
+        if match:
+            return self._normalize_phone_number(match.group(0))
+
         return None
     
     def _normalize_phone_number(self, phone):
@@ -86,9 +91,15 @@ class MessagingManager:
         """
         if not phone:
             return None
-        
+
+        # Fast path: already E.164 US format (+1XXXXXXXXXX), common when a
+        # previously normalized number is passed back through (e.g. via
+        # send_sms); skips the regex strip and length dispatch entirely
+        if len(phone) == 12 and phone[0] == '+' and phone[1] == '1' and phone[2:].isdigit():
+            return phone
+
         # Remove non-digit characters
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = _NON_DIGIT.sub('', phone)
         
         # Handle US numbers (assuming all are US numbers for this project)
         if len(digits_only) == 10:
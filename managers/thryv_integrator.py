@@ -20,16 +20,21 @@ class ThryvIntegrator:
                       and other configuration parameters.
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], session: Optional[requests.Session] = None):
         """
         Initialize the ThryvIntegrator with the provided configuration.
-        
+
         Args:
             config (dict): Configuration dictionary.
+            session (requests.Session, optional): Shared HTTP session for
+                connection pooling; one is created if not provided.
         """
         self.config = config
         self.api_key = config.get('thryv', {}).get('api_key')
         self.account_id = config.get('thryv', {}).get('account_id')
+        # Reusing one session keeps the TCP+TLS connection to the Thryv API
+        # alive across calls instead of re-handshaking per request
+        self._session = session if session is not None else requests.Session()
         
         # Thryv API endpoints
         self.base_url = "https://api.thryv.com/v1"
@@ -52,7 +57,7 @@ class ThryvIntegrator:
         try:
             # Make a simple test call to verify authentication
             headers = self._get_headers()
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/accounts/{self.account_id}",
                 headers=headers
             )
@@ -161,7 +166,7 @@ class ThryvIntegrator:
         try:
             # Make API request to create lead
             headers = self._get_headers()
-            response = requests.post(
+            response = self._session.post(
                 self.leads_endpoint,
                 headers=headers,
                 json=thryv_lead
@@ -10,13 +10,17 @@ from utils.logger import setup_logger
 logger = setup_logger('craigslist_scraper')
 
 class CraigslistScraper:
-    def __init__(self, config):
+    def __init__(self, config, session=None):
         """
         Initialize the Craigslist scraper
-        
+
         Args:
             config (dict): Configuration dictionary
+            session (requests.Session, optional): Shared HTTP session for
+                connection pooling; one is created if not provided
         """
+        # A pooled session reuses connections across the many page fetches
+        self._session = session if session is not None else requests.Session()
         self.urls = config['scraper']['craigslist_urls']
         self.min_year = config['scraper']['min_vehicle_year']
         self.headers = {
@@ -36,7 +40,7 @@ class CraigslistScraper:
         """
         try:
             logger.info(f"Fetching URL: {url}")
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self._session.get(url, headers=self.headers, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Failed to fetch {url}. Status code: {response.status_code}")
@@ -226,6 +226,27 @@ class MockDataManager:
             logger.error(f"Error updating Thryv status in mock Google Sheet: {str(e)}")
             return False
 
+    def batch_update_thryv_statuses(self, status_updates):
+        """
+        Update Thryv status for many rows at once.
+
+        Args:
+            status_updates (list): List of dicts with keys 'row_index',
+                                   'thryv_status' and optional 'thryv_lead_id'
+
+        Returns:
+            bool: Success status
+        """
+        success = True
+        for update in status_updates:
+            if not self.update_thryv_status(
+                update['row_index'],
+                update['thryv_status'],
+                update.get('thryv_lead_id')
+            ):
+                success = False
+        return success
+
 
 class MockNotificationManager:
     """Mock notification manager for sending notifications to the client."""
@@ -44,7 +44,7 @@ class TestCraigslistScraper(unittest.TestCase):
         title = "2021 Car for Sale"
         self.assertEqual(self.scraper._extract_model(title), "")
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_listing_page(self, mock_get):
         """Test fetching listing page"""
         # Mock successful response
@@ -93,11 +93,13 @@ class TestMainAgent(unittest.TestCase):
         mock_craigslist_scraper.return_value = mock_scraper_instance
         
         # Ensure we use dry run mode to avoid actual API calls even if mock setup is incomplete
-        # This is a safer approach for testing
-        with patch('main_agent.MessagingManager'), \
-             patch('main_agent.DataManager'), \
-             patch('main_agent.NotificationManager'), \
-             patch('main_agent.ThryvIntegrator') as mock_thryv:
+        # This is a safer approach for testing.
+        # main_agent imports the managers lazily inside main(), so the
+        # patches target the source modules rather than main_agent attributes
+        with patch('managers.messaging_manager.MessagingManager'), \
+             patch('managers.data_manager.DataManager'), \
+             patch('managers.notification_manager.NotificationManager'), \
+             patch('managers.thryv_integrator.ThryvIntegrator') as mock_thryv:
             
             # Set up ThryvIntegrator mock
             mock_thryv_instance = MagicMock()
@@ -117,9 +119,9 @@ class TestMainAgent(unittest.TestCase):
     @patch('utils.mock_services.MockGoogleSheetsService.append')
     @patch('utils.mock_services.MockThryvService.create_lead')
     @patch('utils.mock_services.MockEmailService.send_email')
-    @patch('main_agent.DataManager')
-    @patch('main_agent.CraigslistScraper')
-    @patch('main_agent.ThryvIntegrator')
+    @patch('managers.data_manager.DataManager')
+    @patch('scrapers.craigslist_scraper.CraigslistScraper')
+    @patch('managers.thryv_integrator.ThryvIntegrator')
     def test_main_full_workflow(self, mock_thryv_cls, mock_scraper_cls, mock_data_manager_cls, 
                                 mock_email, mock_thryv, mock_sheets, mock_sms):
         """Test the entire workflow with mock services."""
@@ -171,8 +173,11 @@ class TestMainAgent(unittest.TestCase):
         ]
         mock_data_manager_cls.return_value = mock_data_manager
         
-        # Run main with real class mocking instead of service mocking
-        with patch('main_agent.MessagingManager'), patch('main_agent.NotificationManager'):
+        # Run main with real class mocking instead of service mocking; the
+        # managers are imported lazily inside main(), so patch their source
+        # modules
+        with patch('managers.messaging_manager.MessagingManager'), \
+             patch('managers.notification_manager.NotificationManager'):
             # Run with dry_run=True for safer testing
             result = main(use_mock=False, dry_run=True)
         
@@ -85,7 +85,7 @@ class TestThryvIntegrator(unittest.TestCase):
         # Verify no contact info is included
         self.assertNotIn('contact', thryv_lead)
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_authenticate_success(self, mock_get):
         """Test authentication success case."""
         # Set up mock response
@@ -102,7 +102,7 @@ class TestThryvIntegrator(unittest.TestCase):
             headers=self.thryv._get_headers()
         )
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_authenticate_failure(self, mock_get):
         """Test authentication failure case."""
         # Set up mock response
@@ -116,7 +116,7 @@ class TestThryvIntegrator(unittest.TestCase):
         # Verify result
         self.assertFalse(result)
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_thryv_lead_success(self, mock_post):
         """Test successful lead creation."""
         # Set up mock response
@@ -142,7 +142,7 @@ class TestThryvIntegrator(unittest.TestCase):
         self.assertEqual(payload['accountId'], 'test_account_id')
         self.assertEqual(payload['title'], 'Used Car Lead - 2022 Toyota Camry')
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_thryv_lead_failure(self, mock_post):
         """Test failed lead creation."""
         # Set up mock response
@@ -1,5 +1,6 @@
 import logging
 import os
+import sys
 from logging.handlers import RotatingFileHandler
 
 # Check if we're running on Vercel
@@ -21,13 +22,17 @@ def setup_logger(name, log_file='logs/carfinder.log', level=logging.INFO):
     Returns:
         logging.Logger: Configured logger
     """
-    # Create a logger
+    # Create a logger at the requested level; keeping the logger itself at
+    # the threshold (rather than DEBUG) lets isEnabledFor() guards in the
+    # callers actually skip debug-message formatting
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
-    # Create console handler (always used)
-    console_handler = logging.StreamHandler()
-    
+
+    # Create console handler (always used); stdout so console output can be
+    # captured/piped like normal program output
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(level)
+
     # Create formatters
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     